@@ -1,32 +1,208 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
 import datetime
 import os
 import json
 import argparse
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-import pickle
 import re
-from dateutil import parser
 import tkinter as tk
+import tkinter.font
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
-from io import BytesIO
 import threading
 import concurrent.futures
+import queue
+import bisect
+import collections
+import itertools
+import operator
 import sys
+import logging
+import hashlib
+import uuid
+import time
+import functools
+
+logger = logging.getLogger(__name__)
 
 # Script constants
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "config.json")
-TOKEN_PATH = os.path.join(SCRIPT_DIR, "token.pickle")
+TOKEN_PATH = os.path.join(SCRIPT_DIR, "token.json")
 DEFAULT_CREDENTIALS_PATH = os.path.join(SCRIPT_DIR, "credentials.json")
+HTTP_CACHE_DIR = os.path.join(SCRIPT_DIR, "http_cache")
+CALENDAR_HTTP_CACHE_DIR = os.path.join(HTTP_CACHE_DIR, "calendar")
+CALENDAR_HTTP_CACHE_MAX_AGE = 2 * 24 * 3600  # Listings are keyed by day, so older ones are never reused
+PAGE_CACHE_MAX_AGE = 30 * 24 * 3600  # Pages unused this long belong to events that are over
 
 # Google Calendar API setup
 SCOPES = ['https://www.googleapis.com/auth/calendar']
+CALENDAR_BATCH_SIZE = 50  # Calendar API limit for requests per batch
+CALENDAR_RETRY_WORKERS = 8  # Concurrent individual requests when a batch entry has to be retried
+CALENDAR_NUM_RETRIES = 4  # Backoff retries per individual request on 429/5xx
+CALENDAR_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Per-thread authorized connections for concurrent Calendar requests
+_THREAD_HTTP = threading.local()
+
+# Authenticated (service, calendar_id), built once per run by get_calendar_service()
+_SERVICE_CACHE = None
+_SERVICE_LOCK = threading.Lock()
+
+# Existing-event listings per calendar: calendar_id -> (monotonic time, time_min, time_max, events)
+_EXISTING_EVENTS_CACHE = {}
+EXISTING_EVENTS_TTL = 600  # seconds
+
+# HTTP settings for LeekDuck requests
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024  # upper bound on a single LeekDuck page
+DETAIL_FETCH_WORKERS = 8  # concurrent detail-page fetches, kept below the pool size
+DETAIL_PARSE_PROCESS_THRESHOLD = 8  # changed detail pages needed before parsing in worker processes
+
+# Shared session so the detail-page workers reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+# HTML parser used for all BeautifulSoup parsing (C-based, much faster than html.parser).
+# Falls back to the pure-Python html.parser when lxml isn't installed.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Only <div>/<a> subtrees of the events index are searched, so <head>, scripts
+# and other top-level markup outside them are never turned into Tag objects.
+# Container tags are kept too: an item's parent class is used to type raid and
+# battle events, and dropping the parent would leave the item under [document]
+_INDEX_STRAINER = SoupStrainer([
+    'div', 'a', 'section', 'article', 'aside', 'main', 'nav', 'header', 'footer',
+    'ul', 'ol', 'li', 'span', 'p', 'table', 'tbody', 'tr', 'td'
+])
+
+# Precompiled patterns used while parsing LeekDuck pages
+_WEEKDAYS = r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)'
+_MONTHS = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+_DATE_CLEAN_RE = re.compile(r'\s+')
+_DATE_PARSE_RE = re.compile(r'\w+, (\w+) (\d+), (\d+),? at (\d+):(\d+) ([AP])M')
+_MONTH_NUMBERS = {
+    name: number for number, name in enumerate((
+        "january", "february", "march", "april", "may", "june", "july",
+        "august", "september", "october", "november", "december"
+    ), start=1)
+}
+_DATE_PAT = re.compile(rf'({_WEEKDAYS},\s+{_MONTHS}\s+\d{{1,2}}(?:,\s+\d{{4}})?)')
+_TIME_PAT = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))')
+_WEEKDAY_PROBE = re.compile(rf'{_WEEKDAYS},\s+{_MONTHS}')
+_BONUS_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"special bonus is\s*(?:\*\*)?(.*?)(?:\*\*)?(?:\.|\s|$)",
+    r"bonus is\s*(?:\*\*)?(.*?)(?:\*\*)?(?:\.|\s|$)",
+    r"bonus:\s*(?:\*\*)?(.*?)(?:\*\*)?(?:\.|\s|$)",
+    r"(\d+[×x].+?(?:Candy|XP|Stardust|Dust))",
+    r"double\s+(.+?(?:Candy|XP|Stardust|Dust))",
+)]
+
+# strptime formats for the "Mon, Jan 15[, 2025] 3:00PM" dates on the events page
+_LISTING_DATETIME_FORMATS = ("%a, %b %d, %Y %I:%M%p", "%a, %b %d %I:%M%p")
+
+def parse_listing_datetime(date_str, time_str):
+    """Parse the date and time matched on the events page, falling back to dateutil"""
+    datetime_str = f"{_DATE_CLEAN_RE.sub(' ', date_str)} {time_str.replace(' ', '').upper()}"
+    for fmt in _LISTING_DATETIME_FORMATS:
+        try:
+            parsed = datetime.datetime.strptime(datetime_str, fmt)
+        except ValueError:
+            continue
+        if "%Y" not in fmt:
+            # Listings without a year refer to the current one, as dateutil assumes
+            parsed = parsed.replace(year=datetime.date.today().year)
+        return parsed
+    
+    # Only unusual listings get here, so dateutil is imported on first use
+    from dateutil import parser as date_parser
+    return date_parser.parse(f"{date_str} {time_str}")
+
+# Title keywords mapped to event types, checked in priority order
+_EVENT_TYPE_KEYWORDS = (
+    ("raid", "Raid"),
+    ("community day", "Community Day"),
+    ("spotlight", "Spotlight"),
+    ("battle", "Battle"),
+    ("league", "Battle"),
+    ("hatch", "Hatch Day"),
+    ("mega", "Mega"),
+    ("ticket", "Ticket"),
+    ("shadow", "Shadow"),
+)
+
+# Title elements on the events page: headings/emphasis with no class, an empty or
+# whitespace-only class, or a "title" class
+_TITLE_SELECTOR = ", ".join(
+    f'{tag}:not([class]), {tag}[class=""], {tag}[class*="title" i]'
+    for tag in ('h2', 'h3', 'h4', 'strong', 'span')
+)
+
+# Candidate containers and items on the events page, matched by soupsieve
+# instead of a Python class predicate per tag
+_EVENT_SECTION_SELECTOR = 'div[class*="event" i], div[class*="raids" i]'
+_BROAD_ITEM_SELECTOR = ", ".join(
+    f'{tag}[class*="{word}" i]' for tag in ('div', 'a') for word in ('item', 'event', 'raid')
+)
+
+def categorize_event(title):
+    """Return the event type for a title based on the first matching keyword"""
+    title_lower = title.lower()
+    return next((event_type for keyword, event_type in _EVENT_TYPE_KEYWORDS if keyword in title_lower), "General")
+
+def _declared_encoding(response, body):
+    """Return the page's declared charset, defaulting to UTF-8 when none is declared
+    
+    Always returning an encoding keeps BeautifulSoup from falling back to
+    byte-level charset detection on undeclared pages.
+    """
+    # requests falls back to ISO-8859-1 for text/* without a charset, which
+    # would override the page's own <meta charset>, so only trust the header
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    # Same <?xml encoding>/<meta charset> scan, over the same prefix, that
+    # BeautifulSoup runs itself when it isn't given an encoding
+    declared = EncodingDetector.find_declared_encoding(body, is_html=True) if body else None
+    return declared or "utf-8"
+
+# Default colors for each event type
+DEFAULT_EVENT_COLORS = {
+    "Raid": "#E57373",          # Light Red
+    "Community Day": "#81C784", # Light Green
+    "Spotlight": "#64B5F6",     # Light Blue
+    "Battle": "#FFB74D",        # Light Orange
+    "Hatch Day": "#9575CD",     # Light Purple
+    "Mega": "#FF8A65",          # Light Deep Orange
+    "General": "#B0BEC5",       # Light Blue Grey
+    "Ticket": "#4DB6AC",        # Light Teal
+    "Shadow": "#9E9E9E"         # Light Grey
+}
+
+# Pokémon names matched in event titles when config.json has no "pokemon_list"
+DEFAULT_POKEMON_LIST = (
+    "pikachu", "eevee", "charmander", "bulbasaur", "squirtle", 
+    "machop", "abra", "gastly", "magikarp", "dratini", "chikorita",
+    "cyndaquil", "totodile", "mareep", "larvitar", "treecko", 
+    "torchic", "mudkip", "ralts", "slakoth", "bagon", "beldum",
+    "turtwig", "chimchar", "piplup", "gible", "snivy", "tepig", 
+    "oshawott", "axew", "chespin", "fennekin", "froakie", "fletchling",
+    "rowlet", "litten", "popplio", "grookey", "scorbunny", "sobble",
+    "pikipek", "rookidee", "pawmi", "sandygast", "poochyena", "golett",
+    "tapu fini", "tapu bulu", "suicune", "houndoom", "gyarados",
+    "altaria", "regirock", "regigigas", "uxie", "mesprit", "azelf", 
+    "gastly", "sableye", "machamp"
+)
 
 def create_default_config():
     """Create a default configuration file if it doesn't exist"""
@@ -37,7 +213,7 @@ def create_default_config():
         },
         "leekduck": {
             "url": "https://leekduck.com/events/",
-            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+            "user_agent": DEFAULT_USER_AGENT
         },
         "app": {
             "window_size": "1000x700",
@@ -45,24 +221,18 @@ def create_default_config():
                 {"method": "popup", "minutes": 60},
                 {"method": "popup", "minutes": 10}
             ],
-            "timezone": "America/New_York"
+            "timezone": "America/New_York",
+            "log_level": "INFO"
         },
-        "event_colors": {
-            "Raid": "#E57373",
-            "Community Day": "#81C784",
-            "Spotlight": "#64B5F6",
-            "Battle": "#FFB74D",
-            "Hatch Day": "#9575CD",
-            "Mega": "#FF8A65",
-            "General": "#B0BEC5",
-            "Ticket": "#4DB6AC",
-            "Shadow": "#9E9E9E"
-        }
+        "event_colors": dict(DEFAULT_EVENT_COLORS)
     }
     
     try:
         with open(CONFIG_PATH, 'w') as f:
             json.dump(default_config, f, indent=4)
+        # Drop anything cached from the previous config file
+        load_config.cache_clear()
+        _pokemon_pattern.cache_clear()
         print(f"Created default configuration file at {CONFIG_PATH}")
         print("Please edit this file with your Google API credentials before running the script again.")
         return default_config
@@ -70,8 +240,13 @@ def create_default_config():
         print(f"Error creating default configuration: {str(e)}")
         sys.exit(1)
 
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.json"""
+    """Load configuration from config.json
+    
+    The parsed config is cached for the rest of the run; callers share the
+    returned dict and must not modify it.
+    """
     # Check if config file exists
     if not os.path.exists(CONFIG_PATH):
         print("Configuration file not found. Creating default configuration...")
@@ -92,8 +267,45 @@ def load_config():
         print(f"Error loading configuration: {str(e)}")
         sys.exit(1)
 
+def _prune_cache_dir(directory, max_age):
+    """Delete files directly in directory not modified for max_age seconds
+    
+    Subdirectories (such as the calendar cache inside http_cache) are left alone.
+    """
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Could not prune cache {directory}: {str(e)}")
+
+def _prune_calendar_http_cache():
+    """Delete cached Calendar responses older than CALENDAR_HTTP_CACHE_MAX_AGE seconds"""
+    _prune_cache_dir(CALENDAR_HTTP_CACHE_DIR, CALENDAR_HTTP_CACHE_MAX_AGE)
+
 def get_calendar_service():
+    """Return the (service, calendar_id) pair, authenticating only on the first call"""
+    global _SERVICE_CACHE
+    with _SERVICE_LOCK:
+        if _SERVICE_CACHE is None:
+            _SERVICE_CACHE = _build_calendar_service()
+        return _SERVICE_CACHE
+
+def _build_calendar_service():
     """Set up and return Google Calendar service with improved error handling"""
+    # Imported here so scraping doesn't pay for loading the Google client libraries
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+    from googleapiclient.discovery import build
+    from googleapiclient.http import build_http
+    import google_auth_httplib2
+    import httplib2
+    
     config = load_config()
     creds = None
     
@@ -106,16 +318,15 @@ def get_calendar_service():
         credentials_path = os.path.join(SCRIPT_DIR, credentials_path)
     
     try:
-        # The file token.pickle stores the user's access and refresh tokens
+        # The file token.json stores the user's access and refresh tokens
         if os.path.exists(TOKEN_PATH):
-            with open(TOKEN_PATH, 'rb') as token:
-                try:
-                    creds = pickle.load(token)
-                    print("Loaded credentials from token.pickle")
-                except Exception as e:
-                    print(f"Error loading token.pickle: {str(e)}")
-                    print("Will create new authentication token")
-                    creds = None
+            try:
+                creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
+                print("Loaded credentials from token.json")
+            except Exception as e:
+                print(f"Error loading token.json: {str(e)}")
+                print("Will create new authentication token")
+                creds = None
         
         # If credentials don't exist or are invalid, get new ones
         if not creds or not creds.valid:
@@ -137,7 +348,7 @@ def get_calendar_service():
                     print(f"ERROR: Could not find credentials file at {credentials_path}")
                     print("Make sure you've set up a Google API project and downloaded the credentials.json file.")
                     print("For instructions, see: https://developers.google.com/calendar/api/quickstart/python")
-                    sys.exit(1)
+                    raise FileNotFoundError(f"Could not find credentials file at {credentials_path}")
                 
                 print("Starting new authentication flow...")
                 flow = InstalledAppFlow.from_client_secrets_file(
@@ -146,11 +357,19 @@ def get_calendar_service():
                 print("Authentication successful!")
             
             # Save credentials for next run
-            with open(TOKEN_PATH, 'wb') as token:
-                pickle.dump(creds, token)
-                print("Saved new token to token.pickle")
-        
-        service = build('calendar', 'v3', credentials=creds)
+            with open(TOKEN_PATH, 'w') as token:
+                token.write(creds.to_json())
+                print("Saved new token to token.json")
+        
+        # Responses are kept in an on-disk httplib2 cache, so repeat listings of an
+        # unchanged calendar are revalidated with If-None-Match instead of re-downloaded
+        http = build_http()
+        http.cache = httplib2.FileCache(CALENDAR_HTTP_CACHE_DIR)
+        _prune_calendar_http_cache()
+        # The discovery document ships with google-api-python-client 2.x, so building
+        # the service needs no network round trip and no discovery cache
+        service = build('calendar', 'v3', http=google_auth_httplib2.AuthorizedHttp(creds, http=http),
+                        static_discovery=True, cache_discovery=False)
         return service, calendar_id
         
     except Exception as e:
@@ -159,143 +378,355 @@ def get_calendar_service():
         traceback.print_exc()
         raise
 
-def get_detailed_event_info(event_url, headers, event_data):
-    """Extract detailed start and end times from event's detail page"""
-    try:
-        response = requests.get(event_url, headers=headers)
+def _cache_paths(url):
+    """Return the (metadata, body) cache file paths for a URL"""
+    base = os.path.join(HTTP_CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest())
+    return base + ".json", base + ".html"
+
+def fetch_page(session, url, headers=None):
+    """GET a URL with streaming, reading at most MAX_RESPONSE_BYTES of a 200 response
+    
+    Returns (response, body); body is None for non-200 responses.
+    """
+    with session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
         if response.status_code != 200:
-            print(f"Failed to fetch detailed page for {event_data.get('title')}: {response.status_code}")
-            return event_data
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for start and end times on the detailed page
-        start_label = soup.find(string=lambda text: text and "start" in text.lower())
-        end_label = soup.find(string=lambda text: text and "end" in text.lower())
-        
-        # Extract bonus information for Spotlight events
-        if event_data.get('event_type') == "Spotlight":
-            # First try to find the exact pattern from your example
-            all_paragraphs = soup.find_all('p')
-            bonus_info = None
-            
-            # Debug: Print the paragraphs to see their content
-            for i, paragraph in enumerate(all_paragraphs):
-                text = paragraph.get_text().strip()
-                print(f"Paragraph {i}: {text}")
-                
-                # Look specifically for the pattern from your example
-                if "special bonus is" in text.lower():
-                    # Find the position of "special bonus is"
-                    start_pos = text.lower().find("special bonus is")
-                    # Extract everything after "special bonus is"
-                    raw_bonus = text[start_pos + len("special bonus is"):].strip()
-                    # Clean up any markdown or extra characters
-                    bonus_info = raw_bonus.replace("**", "").strip()
-                    print(f"Found bonus text: {bonus_info}")
-                    break
+            return response, None
+        body = response.raw.read(MAX_RESPONSE_BYTES + 1, decode_content=True)
+    
+    if len(body) > MAX_RESPONSE_BYTES:
+        logger.warning("Response from %s exceeded %d bytes, truncating", url, MAX_RESPONSE_BYTES)
+        body = body[:MAX_RESPONSE_BYTES]
+    return response, body
+
+def _write_cache(url, response, body, encoding):
+    """Store a response body and its validators in the on-disk cache"""
+    meta_path, body_path = _cache_paths(url)
+    meta = {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'encoding': encoding,
+    }
+    try:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        with open(body_path + ".tmp", 'wb') as f:
+            f.write(body)
+        os.replace(body_path + ".tmp", body_path)
+        with open(meta_path + ".tmp", 'w') as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)
+    except OSError as e:
+        logger.debug("Could not cache %s: %s", url, e)
+
+def cached_get(session, url):
+    """Fetch a page, revalidating any cached copy with If-None-Match/If-Modified-Since
+    
+    Returns (status_code, content, encoding, meta). A 304 is served from the
+    cache as a 200, with meta set to the cached metadata; otherwise meta is None.
+    """
+    meta_path, body_path = _cache_paths(url)
+    meta = None
+    conditional_headers = {}
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        if meta.get('etag'):
+            conditional_headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            conditional_headers['If-Modified-Since'] = meta['last_modified']
+    except (OSError, ValueError):
+        meta = None
+    
+    response, body = fetch_page(session, url, conditional_headers)
+    if response.status_code == 304 and meta is not None:
+        try:
+            with open(body_path, 'rb') as f:
+                logger.debug("Not modified, using cached copy of %s", url)
+                content = f.read()
+            # Mark the entry as in use so pruning only removes pages no longer listed
+            os.utime(body_path)
+            os.utime(meta_path)
+            return 200, content, meta.get('encoding'), meta
+        except OSError:
+            # Cached body is gone, fetch the page again unconditionally
+            response, body = fetch_page(session, url)
+    
+    if response.status_code != 200:
+        return response.status_code, None, None, None
+    
+    encoding = _declared_encoding(response, body)
+    if response.headers.get('ETag') or response.headers.get('Last-Modified'):
+        _write_cache(url, response, body, encoding)
+    return 200, body, encoding, None
+
+def _first_text_line(element):
+    """Return the first line of element.get_text().strip() without joining all its text"""
+    parts = []
+    strings = iter(element.strings)
+    for text in strings:
+        if not parts:
+            # Leading whitespace is stripped before the first line is taken
+            text = text.lstrip()
+            if not text:
+                continue
+        newline = text.find('\n')
+        if newline != -1:
+            parts.append(text[:newline])
+            line = ''.join(parts)
+            # If nothing but whitespace follows, strip() also trimmed this line's end
+            if text[newline:].isspace() and not any(rest.strip() for rest in strings):
+                line = line.rstrip()
+            return line
+        parts.append(text)
+    return ''.join(parts).rstrip()
+
+def _find_time_labels(soup):
+    """Find the first text nodes mentioning "start" and "end" in a single pass"""
+    start_label = None
+    end_label = None
+    for text in soup.strings:
+        lowered = text.lower()
+        if start_label is None and "start" in lowered:
+            start_label = text
+        if end_label is None and "end" in lowered:
+            end_label = text
+        if start_label is not None and end_label is not None:
+            break
+    return start_label, end_label
+
+def _clean_date_string(date_str):
+    """Parse a detail page date, e.g. Tuesday, June 10, 2025, at 6:00 PM Local Time"""
+    if not date_str:
+        return None
+        
+    # Clean up extra spaces and remove "Local Time"
+    date_str = _DATE_CLEAN_RE.sub(' ', date_str).strip()
+    date_str = date_str.replace(" Local Time", "")
+    
+    # Extract the date components with regex
+    match = _DATE_PARSE_RE.match(date_str)
+    
+    if match:
+        month_name, day, year, hour, minute, meridiem = match.groups()
+        month = _MONTH_NUMBERS.get(month_name.lower())
+        hour = int(hour)
+        # Build the datetime straight from the captured fields when they have the
+        # shape strptime's %Y/%d accept; short years and the like go to strptime
+        if month and 1 <= hour <= 12 and len(year) == 4 and len(day) <= 2 and len(minute) <= 2:
+            try:
+                return datetime.datetime(
+                    int(year), month, int(day),
+                    hour % 12 + (12 if meridiem == 'P' else 0), int(minute)
+                )
+            except ValueError:
+                pass
+        
+        # Anything unusual goes through strptime, which also reports the failure
+        clean_str = f"{month_name} {day}, {year} {hour}:{minute} {meridiem}M"
+        try:
+            parsed_date = datetime.datetime.strptime(clean_str, "%B %d, %Y %I:%M %p")
+            return parsed_date
+        except ValueError:
+            logger.warning("Failed to parse cleaned date string: %s", clean_str)
+    
+    return None
+
+def parse_detail_page(content, encoding, event_type):
+    """Extract start/end times, Spotlight bonus and description from a detail page
+    
+    Returns a dict with 'start_time', 'end_time', 'bonus' and 'description'
+    keys; fields that weren't found are None.
+    """
+    soup = BeautifulSoup(content, HTML_PARSER, from_encoding=encoding)
+    fields = {'start_time': None, 'end_time': None, 'bonus': None, 'description': None}
+    
+    # Look for start and end times on the detailed page
+    start_label, end_label = _find_time_labels(soup)
+    
+    # Extract bonus information for Spotlight events
+    if event_type == "Spotlight":
+        # Extract each paragraph's text once for both passes below
+        para_texts = [paragraph.get_text().strip() for paragraph in soup.find_all('p')]
+        bonus_info = None
+        
+        # First try to find the exact pattern from your example
+        for i, text in enumerate(para_texts):
+            logger.debug("Paragraph %d: %s", i, text)
             
-            # If we don't find the exact pattern, try other common patterns
-            if not bonus_info:
-                patterns = [
-                    r"special bonus is\s*(?:\*\*)?(.*?)(?:\*\*)?(?:\.|\s|$)",
-                    r"bonus is\s*(?:\*\*)?(.*?)(?:\*\*)?(?:\.|\s|$)",
-                    r"bonus:\s*(?:\*\*)?(.*?)(?:\*\*)?(?:\.|\s|$)",
-                    r"(\d+[×x].+?(?:Candy|XP|Stardust|Dust))",
-                    r"double\s+(.+?(?:Candy|XP|Stardust|Dust))",
-                ]
-                
-                for paragraph in all_paragraphs:
-                    text = paragraph.get_text().strip()
-                    for pattern in patterns:
-                        match = re.search(pattern, text, re.IGNORECASE)
-                        if match:
-                            bonus_info = match.group(1).strip()
-                            print(f"Matched with pattern '{pattern}': {bonus_info}")
-                            break
-                    if bonus_info:
+            # Look specifically for the pattern from your example
+            start_pos = text.lower().find("special bonus is")
+            if start_pos != -1:
+                # Extract everything after "special bonus is"
+                raw_bonus = text[start_pos + len("special bonus is"):].strip()
+                # Clean up any markdown or extra characters
+                bonus_info = raw_bonus.replace("**", "").strip()
+                logger.debug("Found bonus text: %s", bonus_info)
+                break
+        
+        # If we don't find the exact pattern, try other common patterns
+        if not bonus_info:
+            for text in para_texts:
+                for pattern in _BONUS_PATTERNS:
+                    match = pattern.search(text)
+                    if match:
+                        bonus_info = match.group(1).strip()
+                        logger.debug("Matched with pattern '%s': %s", pattern.pattern, bonus_info)
                         break
-            
-            if bonus_info:
-                event_data['bonus'] = bonus_info
-                print(f"Found bonus for {event_data.get('title')}: {bonus_info}")
-        
-        # Function to clean date strings
-        def clean_date_string(date_str):
-            if not date_str:
-                return None
-                
-            # Clean up extra spaces and remove "Local Time"
-            date_str = re.sub(r'\s+', ' ', date_str).strip()
-            date_str = date_str.replace(" Local Time", "")
-            
-            # Extract the date components with regex
-            pattern = r'(\w+), (\w+ \d+, \d+),? at (\d+:\d+ [AP]M)'
-            match = re.match(pattern, date_str)
-            
-            if match:
-                weekday, date_part, time_part = match.groups()
-                clean_str = f"{date_part} {time_part}"
-                try:
-                    parsed_date = datetime.datetime.strptime(clean_str, "%B %d, %Y %I:%M %p")
-                    return parsed_date
-                except ValueError:
-                    print(f"Failed to parse cleaned date string: {clean_str}")
-            
-            return None
-        
-        # Extract start time
-        if start_label and start_label.find_next():
-            start_time_text = start_label.find_next().get_text().strip()
-            parsed_start = clean_date_string(start_time_text)
-            if parsed_start:
-                event_data['detailed_start_time'] = parsed_start
-                print(f"Found detailed start time for {event_data.get('title')}: {parsed_start}")
-        
-        # Extract end time
-        if end_label and end_label.find_next():
-            end_time_text = end_label.find_next().get_text().strip()
-            parsed_end = clean_date_string(end_time_text)
-            if parsed_end:
-                event_data['detailed_end_time'] = parsed_end
-                print(f"Found detailed end time for {event_data.get('title')}: {parsed_end}")
-        
-        # If we found both detailed times, use them instead of the main page times
-        if event_data.get('detailed_start_time') and event_data.get('detailed_end_time'):
-            event_data['start_time'] = event_data['detailed_start_time']
-            event_data['end_time'] = event_data['detailed_end_time']
-            event_data['is_multi_day'] = (event_data['end_time'].date() > event_data['start_time'].date())
-            
-            # Update display strings
-            event_data['display_start'] = event_data['start_time'].strftime('%b %d, %Y')
-            event_data['display_end'] = event_data['end_time'].strftime('%b %d, %Y') if event_data['is_multi_day'] else None
-            event_data['display_start_time'] = event_data['start_time'].strftime('%I:%M %p')
-            event_data['display_end_time'] = event_data['end_time'].strftime('%I:%M %p')
-        
-        # Try to extract a better description if available
-        description_elem = soup.find("div", class_="event-description")
-        if description_elem:
-            event_data['description'] = description_elem.get_text().strip()
+                if bonus_info:
+                    break
         
+        fields['bonus'] = bonus_info
+    
+    # Extract start time
+    if start_label and start_label.find_next():
+        fields['start_time'] = _clean_date_string(start_label.find_next().get_text().strip())
+    
+    # Extract end time
+    if end_label and end_label.find_next():
+        fields['end_time'] = _clean_date_string(end_label.find_next().get_text().strip())
+    
+    # Try to extract a better description if available
+    description_elem = soup.find("div", class_="event-description")
+    if description_elem:
+        fields['description'] = description_elem.get_text().strip()
+    
+    return fields
+
+def _load_parsed_fields(meta, event_type):
+    """Return fields cached alongside an unchanged page, or None if there are none"""
+    parsed = (meta or {}).get('parsed')
+    if not parsed or parsed.get('event_type') != event_type:
+        return None
+    fields = dict(parsed['fields'])
+    for key in ('start_time', 'end_time'):
+        if fields[key]:
+            fields[key] = datetime.datetime.fromisoformat(fields[key])
+    return fields
+
+def _store_parsed_fields(url, event_type, fields):
+    """Save extracted fields next to a cached page so a 304 can skip parsing"""
+    meta_path, _ = _cache_paths(url)
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        # Page wasn't cached (no validators), so there is nothing to attach to
+        return
+    
+    serialized = dict(fields)
+    for key in ('start_time', 'end_time'):
+        if serialized[key]:
+            serialized[key] = serialized[key].isoformat()
+    meta['parsed'] = {'event_type': event_type, 'fields': serialized}
+    try:
+        with open(meta_path + ".tmp", 'w') as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)
+    except OSError as e:
+        logger.debug("Could not cache parsed fields for %s: %s", url, e)
+
+def _parse_detail_page_safely(content, encoding, event_type):
+    """parse_detail_page for worker processes; returns None instead of raising"""
+    try:
+        return parse_detail_page(content, encoding, event_type)
     except Exception as e:
-        print(f"Error fetching detailed page for {event_data.get('title')}: {str(e)}")
+        logger.warning("Error parsing detail page: %s", e)
+        return None
+
+def fetch_event_details(session, event_data):
+    """Fetch an event's detail page
+    
+    Returns (fields, content, encoding): fields is set when an unchanged page's
+    extracted fields could be reused, content when the page still needs parsing;
+    both are None if the page couldn't be fetched.
+    """
+    try:
+        status_code, content, encoding, meta = cached_get(session, event_data['event_link'])
+    except Exception as e:
+        logger.warning("Error fetching detailed page for %s: %s", event_data.get('title'), e)
+        return None, None, None
+    
+    if status_code != 200:
+        logger.warning("Failed to fetch detailed page for %s: %s", event_data.get('title'), status_code)
+        return None, None, None
+    
+    # An unchanged page reuses the fields extracted when it was last parsed
+    fields = _load_parsed_fields(meta, event_data.get('event_type'))
+    if fields is not None:
+        logger.debug("Using cached details for %s", event_data.get('title'))
+        return fields, None, None
+    return None, content, encoding
+
+def apply_event_details(event_data, fields):
+    """Update an event with the fields extracted from its detail page"""
+    if fields['bonus']:
+        event_data['bonus'] = fields['bonus']
+        logger.debug("Found bonus for %s: %s", event_data.get('title'), fields['bonus'])
+    
+    if fields['start_time']:
+        event_data['detailed_start_time'] = fields['start_time']
+        logger.debug("Found detailed start time for %s: %s", event_data.get('title'), fields['start_time'])
+    
+    if fields['end_time']:
+        event_data['detailed_end_time'] = fields['end_time']
+        logger.debug("Found detailed end time for %s: %s", event_data.get('title'), fields['end_time'])
+    
+    # If we found both detailed times, use them instead of the main page times
+    if event_data.get('detailed_start_time') and event_data.get('detailed_end_time'):
+        event_data['start_time'] = event_data['detailed_start_time']
+        event_data['end_time'] = event_data['detailed_end_time']
+        event_data['is_multi_day'] = (event_data['end_time'].date() > event_data['start_time'].date())
+        
+        # Update display strings
+        event_data['display_start'] = event_data['start_time'].strftime('%b %d, %Y')
+        event_data['display_end'] = event_data['end_time'].strftime('%b %d, %Y') if event_data['is_multi_day'] else None
+        event_data['display_start_time'] = event_data['start_time'].strftime('%I:%M %p')
+        event_data['display_end_time'] = event_data['end_time'].strftime('%I:%M %p')
+    
+    if fields['description']:
+        event_data['description'] = fields['description']
     
     return event_data
 
-def scrape_leekduck_events():
-    """Scrape events from LeekDuck website with improved time parsing"""
+def _parse_detail_pages(pending):
+    """Parse (content, encoding, event_type) triples, in worker processes when there are many"""
+    contents, encodings, event_types = zip(*pending)
+    if len(pending) >= DETAIL_PARSE_PROCESS_THRESHOLD:
+        try:
+            with concurrent.futures.ProcessPoolExecutor() as executor:
+                return list(executor.map(
+                    _parse_detail_page_safely, contents, encodings, event_types, chunksize=4
+                ))
+        except Exception as e:
+            # e.g. process creation not permitted; parse here instead
+            logger.warning("Parsing detail pages in this process: %s", e)
+    return list(map(_parse_detail_page_safely, contents, encodings, event_types))
+
+def scrape_leekduck_events(existing_keys=None):
+    """Scrape events from LeekDuck website with improved time parsing
+    
+    Events whose (title, start date) is in existing_keys are already on the
+    calendar and are dropped before their detail pages are fetched.
+    """
     config = load_config()
     leekduck_config = config.get("leekduck", {})
     
+    # Drop cached pages of events that haven't been listed for a while
+    _prune_cache_dir(HTTP_CACHE_DIR, PAGE_CACHE_MAX_AGE)
+    
     url = leekduck_config.get("url", "https://leekduck.com/events/")
-    headers = {
-        'User-Agent': leekduck_config.get("user_agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    }
+    SESSION.headers.update({
+        'User-Agent': leekduck_config.get("user_agent", DEFAULT_USER_AGENT)
+    })
     
     try:
-        response = requests.get(url, headers=headers)
-        print(f"Response status code: {response.status_code}")
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response, body = fetch_page(SESSION, url)
+        logger.info("Response status code: %s", response.status_code)
+        soup = BeautifulSoup(
+            body or b"", HTML_PARSER,
+            from_encoding=_declared_encoding(response, body),
+            parse_only=_INDEX_STRAINER
+        )
         
         events = []
         
@@ -303,26 +734,26 @@ def scrape_leekduck_events():
         event_items = []
         
         # Try to find event sections first
-        event_sections = soup.find_all('div', class_=lambda c: c and ('event' in c.lower() or 'raids' in c.lower()))
-        print(f"Found {len(event_sections)} potential event sections")
+        event_sections = soup.select(_EVENT_SECTION_SELECTOR)
+        logger.debug("Found %d potential event sections", len(event_sections))
         
         # If we found sections, extract events from them
         if event_sections:
             for section in event_sections:
-                items = section.find_all('a', href=True)
+                items = section.select('a[href]')
                 event_items.extend(items)
         
         # If no luck with sections, try finding events directly
         if not event_items:
-            event_items = soup.find_all('a', href=lambda h: h and '/events/' in h)
-            print(f"Found {len(event_items)} events with link-based search")
+            event_items = soup.select('a[href*="/events/"]')
+            logger.debug("Found %d events with link-based search", len(event_items))
         
         # If still no luck, try a very broad approach
         if not event_items:
-            event_items = soup.find_all(['div', 'a'], class_=lambda c: c and ('item' in c.lower() or 'event' in c.lower() or 'raid' in c.lower()))
-            print(f"Found {len(event_items)} events with broad class search")
+            event_items = soup.select(_BROAD_ITEM_SELECTOR)
+            logger.debug("Found %d events with broad class search", len(event_items))
 
-        print(f"Total event items found: {len(event_items)}")
+        logger.info("Total event items found: %d", len(event_items))
         
         # Track processed event titles to avoid duplicates
         processed_events = set()
@@ -339,8 +770,11 @@ def scrape_leekduck_events():
                     event_link = 'https://leekduck.com' + event_link
                 event_data['event_link'] = event_link
             
+            # Look up the image once; it's used for the title fallback and the image URL
+            img_elem = item.find('img')
+            
             # Try to extract the title
-            title_elem = item.find(['h2', 'h3', 'h4', 'strong', 'span'], class_=lambda c: not c or 'title' in c.lower())
+            title_elem = item.select_one(_TITLE_SELECTOR)
             if title_elem:
                 event_data['title'] = title_elem.text.strip()
             else:
@@ -348,51 +782,31 @@ def scrape_leekduck_events():
                 bold_text = item.find(['b', 'strong'])
                 if bold_text:
                     event_data['title'] = bold_text.text.strip()
-                else:
+                elif img_elem and img_elem.get('alt'):
                     # If still no title, use the alt text of the image if available
-                    img = item.find('img')
-                    if img and img.get('alt'):
-                        event_data['title'] = img.get('alt').strip()
-                    else:
-                        # Last resort: use any text content
-                        event_data['title'] = item.get_text().strip().split('\n')[0]
+                    event_data['title'] = img_elem.get('alt').strip()
+                else:
+                    # Last resort: use the first line of text content
+                    event_data['title'] = _first_text_line(item)
+            
+            title = event_data.get('title')
             
             # Skip if no title found or title is too generic
-            if not event_data.get('title') or len(event_data.get('title', '')) < 3:
+            if not title or len(title) < 3:
                 continue
             
             # Skip duplicate events (by title)
-            if event_data.get('title') in processed_events:
+            if title in processed_events:
                 continue
                 
-            processed_events.add(event_data.get('title'))
-            print(f"Found event: {event_data.get('title')}")
+            processed_events.add(title)
+            logger.debug("Found event: %s", title)
             
             # Store the original index
             event_data['original_index'] = i
             
             # Determine event type for categorization
-            event_type = "General"
-            title_lower = event_data.get('title', '').lower()
-            
-            # Event type categorization
-            if "raid" in title_lower or "raids" in title_lower:
-                event_type = "Raid"
-            elif "community day" in title_lower:
-                event_type = "Community Day"
-            elif "spotlight" in title_lower:
-                event_type = "Spotlight"
-            elif "battle" in title_lower or "league" in title_lower:
-                event_type = "Battle"
-            elif "hatch" in title_lower:
-                event_type = "Hatch Day"
-            elif "mega" in title_lower:
-                event_type = "Mega"
-            elif "power up ticket" in title_lower or "ticket" in title_lower:
-                event_type = "Ticket"
-            elif "shadow" in title_lower:
-                event_type = "Shadow"
-            
+            event_type = categorize_event(title)
             event_data['event_type'] = event_type
             
             # Check for event category/type from the parent element
@@ -413,22 +827,20 @@ def scrape_leekduck_events():
             date_text = ""
             # Look for date text patterns
             for text in item.stripped_strings:
-                if re.search(r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', text):
-                    date_text = text
+                if _WEEKDAY_PROBE.search(text):
+                    # Plain str, so the event doesn't keep the parsed page alive
+                    date_text = str(text)
                     break
             
             if date_text:
                 event_data['date_text'] = date_text
-                print(f"Event date text: {date_text}")
+                logger.debug("Event date text: %s", date_text)
                 
                 # Preliminary time parsing from main page (may be incomplete)
                 try:
                     # Check for basic date and time patterns
-                    date_pattern = r'((?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:,\s+\d{4})?)'
-                    time_pattern = r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))'
-                    
-                    date_match = re.search(date_pattern, date_text)
-                    time_match = re.search(time_pattern, date_text)
+                    date_match = _DATE_PAT.search(date_text)
+                    time_match = _TIME_PAT.search(date_text)
                     
                     if date_match and time_match:
                         date_str = date_match.group(1)
@@ -437,7 +849,7 @@ def scrape_leekduck_events():
                         # Default parsing attempt from main page
                         try:
                             datetime_str = f"{date_str} {time_str}"
-                            parsed_datetime = parser.parse(datetime_str)
+                            parsed_datetime = parse_listing_datetime(date_str, time_str)
                             
                             # For now, set start and end time the same since we'll update it later
                             event_data['start_time'] = parsed_datetime
@@ -448,12 +860,11 @@ def scrape_leekduck_events():
                             event_data['display_start_time'] = parsed_datetime.strftime('%I:%M %p')
                             event_data['display_end_time'] = (parsed_datetime + datetime.timedelta(hours=1)).strftime('%I:%M %p')
                         except Exception as inner_e:
-                            print(f"Error parsing datetime '{datetime_str}': {str(inner_e)}")
+                            logger.warning("Error parsing datetime '%s': %s", datetime_str, inner_e)
                 except Exception as e:
-                    print(f"Error in basic time parsing for '{event_data.get('title')}': {str(e)}")
+                    logger.warning("Error in basic time parsing for '%s': %s", title, e)
             
             # Extract image
-            img_elem = item.find('img')
             if img_elem and img_elem.get('src'):
                 image_url = img_elem['src']
                 # Make sure URL is absolute
@@ -462,34 +873,50 @@ def scrape_leekduck_events():
                 event_data['image_url'] = image_url
             
             # Initial extraction is complete, add the event to our list
-            if event_data.get('title') and event_data.get('event_link'):
+            if event_data.get('event_link'):
                 events.append(event_data)
         
-        # Now fetch detailed info for each event
-        print("Fetching detailed information for each event...")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit tasks to the executor
-            future_to_event = {
-                executor.submit(get_detailed_event_info, event['event_link'], headers, event): i 
-                for i, event in enumerate(events) if 'event_link' in event
-            }
-            
-            # Process results as they complete
-            for future in concurrent.futures.as_completed(future_to_event):
-                event_idx = future_to_event[future]
-                try:
-                    updated_event = future.result()
-                    events[event_idx] = updated_event
-                except Exception as e:
-                    print(f"Error processing event {events[event_idx].get('title')}: {str(e)}")
-        
-        print(f"Completed scraping {len(events)} events with detailed information.")
+        # Everything needed is now in plain dicts; free the index tree before
+        # the detail pages are fetched and parsed
+        soup.decompose()
+        del soup, event_items
+        
+        # Drop events that are already on the calendar before fetching their details
+        if existing_keys:
+            listed_count = len(events)
+            events = [
+                event for event in events
+                if not event.get('start_time') or (event['title'], event['start_time'].date()) not in existing_keys
+            ]
+            logger.info("Skipping %d events already on the calendar", listed_count - len(events))
+        
+        # Now fetch detailed info for each event; threads fetch pages, then the
+        # pages that changed are parsed (CPU-bound) in worker processes
+        logger.info("Fetching detailed information for each event...")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+            fetched = list(executor.map(lambda event: fetch_event_details(SESSION, event), events))
+        
+        pending = []
+        for event, (fields, content, encoding) in zip(events, fetched):
+            if fields is not None:
+                apply_event_details(event, fields)
+            elif content is not None:
+                pending.append((event, content, encoding))
+        
+        if pending:
+            parsed = _parse_detail_pages([
+                (content, encoding, event.get('event_type')) for event, content, encoding in pending
+            ])
+            for (event, _, _), fields in zip(pending, parsed):
+                if fields is not None:
+                    _store_parsed_fields(event['event_link'], event.get('event_type'), fields)
+                    apply_event_details(event, fields)
+        
+        logger.info("Completed scraping %d events with detailed information.", len(events))
         return events
         
     except Exception as e:
-        print(f"Error scraping LeekDuck: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error scraping LeekDuck: %s", e)
         return []
 
 def is_same_event_type(title1, title2):
@@ -517,20 +944,12 @@ def is_same_event_type(title1, title2):
 
 def is_similar_title(title1, title2):
     """Check if titles are similar enough to be considered the same event"""
-    # Remove common words that might change between updates
     title1 = title1.lower()
     title2 = title2.lower()
     
-    # Common words that might be added/removed in updates
-    common_words = ["featured", "event", "special", "bonus", "update", "the", "a", "an", "in", "on"]
-    
-    # Clean the titles by removing common words
-    clean_title1 = ' '.join([word for word in title1.split() if word.lower() not in common_words])
-    clean_title2 = ' '.join([word for word in title2.split() if word.lower() not in common_words])
-    
     # Check for significant word overlap
-    words1 = set(clean_title1.split())
-    words2 = set(clean_title2.split())
+    words1 = _significant_words(title1)
+    words2 = _significant_words(title2)
     common_words = words1.intersection(words2)
     
     # If they share at least 2 significant words and 50% of the smaller title
@@ -547,55 +966,368 @@ def is_similar_title(title1, title2):
     
     return False
 
+# Common words that might be added/removed in updates
+_TITLE_FILLER_WORDS = frozenset(["featured", "event", "special", "bonus", "update", "the", "a", "an", "in", "on"])
+
+@functools.lru_cache(maxsize=1024)
+def _significant_words(title):
+    """Return a lowercased title's words minus filler, cached since titles recur"""
+    return frozenset(word for word in title.split() if word not in _TITLE_FILLER_WORDS)
+
 def extract_pokemon_name(title):
     """Extract Pokémon name from event title if present"""
+    match = _pokemon_pattern().search(title)
+    return match.group(1).lower() if match else None
+
+@functools.lru_cache(maxsize=1)
+def _pokemon_pattern():
+    """Compile one case-insensitive, word-bounded alternation of the configured Pokémon"""
     # Load Pokemon list from config if available
-    config = load_config()
-    pokemon_list = config.get("pokemon_list", [
-        "pikachu", "eevee", "charmander", "bulbasaur", "squirtle", 
-        "machop", "abra", "gastly", "magikarp", "dratini", "chikorita",
-        "cyndaquil", "totodile", "mareep", "larvitar", "treecko", 
-        "torchic", "mudkip", "ralts", "slakoth", "bagon", "beldum",
-        "turtwig", "chimchar", "piplup", "gible", "snivy", "tepig", 
-        "oshawott", "axew", "chespin", "fennekin", "froakie", "fletchling",
-        "rowlet", "litten", "popplio", "grookey", "scorbunny", "sobble",
-        "pikipek", "rookidee", "pawmi", "sandygast", "poochyena", "golett",
-        "tapu fini", "tapu bulu", "suicune", "houndoom", "gyarados",
-        "altaria", "regirock", "regigigas", "uxie", "mesprit", "azelf", 
-        "gastly", "sableye", "machamp"
-    ])
+    pokemon_list = load_config().get("pokemon_list", DEFAULT_POKEMON_LIST)
+    # Longest names first so e.g. "tapu fini" wins over any shorter name at the same spot
+    names = sorted({name.lower() for name in pokemon_list}, key=len, reverse=True)
+    return re.compile(r'\b(' + '|'.join(map(re.escape, names)) + r')\b', re.IGNORECASE)
+
+def get_existing_events(service, calendar_id, time_min=None, time_max=None):
+    """Get existing events from calendar to avoid duplicates
     
-    title_lower = title.lower()
-    for pokemon in pokemon_list:
-        if pokemon in title_lower:
-            return pokemon
+    time_min/time_max are naive UTC datetimes and default to 90 days from the
+    start of today (UTC). The default is day-aligned so the request URL, and
+    with it the on-disk HTTP cache entry, stays the same across a day's runs.
+    Results are reused for EXISTING_EVENTS_TTL seconds when an earlier listing
+    already covers the requested range.
+    """
+    if time_min is None:
+        time_min = datetime.datetime.combine(datetime.datetime.utcnow().date(), datetime.time())
+    if time_max is None:
+        time_max = time_min + datetime.timedelta(days=90)
     
-    return None
-
-def get_existing_events(service, calendar_id):
-    """Get existing events from calendar to avoid duplicates"""
-    # Get events for the next 90 days
-    now = datetime.datetime.utcnow()
-    end_date = now + datetime.timedelta(days=90)
+    cached = _EXISTING_EVENTS_CACHE.get(calendar_id)
+    if cached:
+        fetched_at, cached_min, cached_max, cached_events = cached
+        if (time.monotonic() - fetched_at < EXISTING_EVENTS_TTL
+                and cached_min <= time_min and time_max <= cached_max):
+            return cached_events
     
-    now_str = now.isoformat() + 'Z'  # 'Z' indicates UTC time
-    end_str = end_date.isoformat() + 'Z'
+    time_min_str = time_min.isoformat() + 'Z'  # 'Z' indicates UTC time
+    time_max_str = time_max.isoformat() + 'Z'
     
     try:
-        events_result = service.events().list(
-            calendarId=calendar_id, 
-            timeMin=now_str,
-            timeMax=end_str,
-            maxResults=2500, 
-            singleEvents=True,
-            orderBy='startTime').execute()
-        return events_result.get('items', [])
+        existing_events = []
+        page_token = None
+        while True:
+            # Only request the fields used for duplicate and unchanged-event detection
+            events_result = service.events().list(
+                calendarId=calendar_id, 
+                timeMin=time_min_str,
+                timeMax=time_max_str,
+                maxResults=2500, 
+                singleEvents=True,
+                orderBy='startTime',
+                fields='items(id,summary,description,start(date,dateTime),end(date,dateTime)),nextPageToken',
+                pageToken=page_token).execute()
+            existing_events.extend(events_result.get('items', []))
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                break
     except Exception as e:
         print(f"Error getting existing events: {str(e)}")
         return []
+    
+    _EXISTING_EVENTS_CACHE[calendar_id] = (time.monotonic(), time_min, time_max, existing_events)
+    return existing_events
+
+def _selected_events_range(events):
+    """Return a (time_min, time_max) UTC listing range covering the events' start dates"""
+    starts = [event['start_time'] for event in events if event.get('start_time')]
+    if not starts:
+        return None, None
+    # Event times are local; a day of slack either side covers any UTC offset
+    time_min = datetime.datetime.combine(min(starts).date(), datetime.time()) - datetime.timedelta(days=1)
+    time_max = datetime.datetime.combine(max(starts).date(), datetime.time()) + datetime.timedelta(days=2)
+    return time_min, time_max
+
+def _existing_event_date(existing):
+    """Return the start date of an existing calendar event, or None if it has none"""
+    start = existing.get('start', {})
+    # Timed events carry 'dateTime', all-day events carry 'date'; both begin with
+    # YYYY-MM-DD in the event's own offset, so the date is read from that prefix
+    value = start.get('dateTime') or start.get('date')
+    if not value:
+        return None
+    return datetime.date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+def get_existing_event_keys(existing_events):
+    """Build a set of (summary, start date) keys for exact-duplicate lookups"""
+    keys = set()
+    for existing in existing_events:
+        existing_date = _existing_event_date(existing)
+        if existing_date:
+            keys.add((existing.get('summary'), existing_date))
+    return keys
+
+def _calendar_time_key(value):
+    """Reduce a Calendar start/end to its date or local wall-clock time, dropping any offset"""
+    return value.get('date') or (value.get('dateTime') or '')[:19]
+
+def calendar_event_content_key(calendar_event):
+    """Hash the summary, description, start and end of a Calendar event body
+    
+    Works on both bodies built by _build_calendar_body and events listed from
+    the calendar, so an unchanged event produces the same key on every run.
+    """
+    content = "\x1f".join((
+        calendar_event.get('summary') or '',
+        calendar_event.get('description') or '',
+        _calendar_time_key(calendar_event.get('start', {})),
+        _calendar_time_key(calendar_event.get('end', {})),
+    ))
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+def group_existing_events_by_date(existing_events):
+    """Bucket existing events as (summary, id) pairs by start date, parsing each date once"""
+    by_date = collections.defaultdict(list)
+    for existing in existing_events:
+        existing_date = _existing_event_date(existing)
+        if existing_date:
+            by_date[existing_date].append((existing.get('summary', ''), existing.get('id')))
+    return by_date
+
+def _http_status(exception):
+    """Return the HTTP status of a failed Calendar request as an int, or None"""
+    status = getattr(getattr(exception, 'resp', None), 'status', None)
+    return None if status is None else int(status)
+
+def _is_retryable(exception):
+    """Whether a failed Calendar request is worth retrying (rate limits and server errors)"""
+    status = _http_status(exception)
+    if status is None:
+        return True  # Transport error, nothing reached the API
+    return status in CALENDAR_RETRY_STATUSES
+
+def _thread_http(shared_http):
+    """Return an authorized httplib2 connection owned by the calling thread
+    
+    httplib2.Http objects are not thread-safe, so concurrent requests each get
+    their own connection built from the service's credentials.
+    """
+    credentials = getattr(shared_http, 'credentials', None)
+    if credentials is None:
+        return shared_http
+    http = getattr(_THREAD_HTTP, 'http', None)
+    if http is None:
+        import google_auth_httplib2
+        from googleapiclient.http import build_http
+        http = _THREAD_HTTP.http = google_auth_httplib2.AuthorizedHttp(credentials, http=build_http())
+    return http
+
+def _execute_individually(requests_by_key):
+    """Execute {key: HttpRequest} concurrently with backoff; return {key: (response, exception)}"""
+    def execute(request):
+        # num_retries backs off exponentially on 429 and 5xx responses
+        return request.execute(http=_thread_http(request.http), num_retries=CALENDAR_NUM_RETRIES)
+    
+    results = {}
+    workers = min(CALENDAR_RETRY_WORKERS, len(requests_by_key))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(execute, request): key for key, request in requests_by_key.items()}
+        for future in concurrent.futures.as_completed(futures):
+            exception = future.exception()
+            results[futures[future]] = (None if exception else future.result(), exception)
+    return results
+
+def delete_events_batched(service, calendar_id, pending_deletes):
+    """Delete (event id, title) pairs using batch HTTP requests; return the ids that failed"""
+    failed_ids = set()
+    retry_deletes = []
+    for chunk_start in range(0, len(pending_deletes), CALENDAR_BATCH_SIZE):
+        chunk = pending_deletes[chunk_start:chunk_start + CALENDAR_BATCH_SIZE]
+        
+        def on_delete(request_id, response, exception, chunk=chunk):
+            event_id, title = chunk[int(request_id)]
+            if exception is None:
+                print(f"Deleted old event: {title}")
+            elif _is_retryable(exception):
+                retry_deletes.append((event_id, title))
+            else:
+                print(f"Failed to delete old event {title}: {str(exception)}")
+                failed_ids.add(event_id)
+        
+        batch = service.new_batch_http_request(callback=on_delete)
+        for i, (event_id, title) in enumerate(chunk):
+            batch.add(service.events().delete(calendarId=calendar_id, eventId=event_id), request_id=str(i))
+        
+        try:
+            batch.execute()
+        except Exception as e:
+            print(f"Batch delete failed, retrying individually: {str(e)}")
+            retry_deletes.extend(chunk)
+    
+    if retry_deletes:
+        titles = dict(retry_deletes)
+        results = _execute_individually({
+            event_id: service.events().delete(calendarId=calendar_id, eventId=event_id)
+            for event_id in titles
+        })
+        for event_id, (response, exception) in results.items():
+            # 410 Gone means an earlier attempt that reported an error did go through
+            if exception is None or _http_status(exception) == 410:
+                print(f"Deleted old event: {titles[event_id]}")
+            else:
+                print(f"Failed to delete old event {titles[event_id]}: {str(exception)}")
+                failed_ids.add(event_id)
+    return failed_ids
+
+def _no_progress(text):
+    pass
 
-def create_calendar_events_direct(selected_events):
-    """Create Google Calendar events with improved update handling"""
+def insert_events_batched(service, calendar_id, pending_inserts, created_events, skipped_events,
+                          progress=_no_progress, cancel=None):
+    """Insert (title, body) pairs using batch HTTP requests, recording the outcome of each
+    
+    If the cancel event is set, batches not yet sent are skipped.
+    """
+    # Inserts aren't idempotent; a client-generated id (hex is valid base32hex) makes
+    # a resent insert that already went through fail with 409 instead of duplicating
+    for title, calendar_event in pending_inserts:
+        calendar_event.setdefault('id', uuid.uuid4().hex)
+    
+    retry_inserts = []
+    for chunk_start in range(0, len(pending_inserts), CALENDAR_BATCH_SIZE):
+        chunk = pending_inserts[chunk_start:chunk_start + CALENDAR_BATCH_SIZE]
+        if cancel is not None and cancel.is_set():
+            skipped_events.extend(f"{title} (cancelled)" for title, _ in pending_inserts[chunk_start:])
+            break
+        progress(f"Adding events {chunk_start + 1}-{chunk_start + len(chunk)} of {len(pending_inserts)}...")
+        
+        def on_insert(request_id, response, exception, chunk=chunk):
+            title = chunk[int(request_id)][0]
+            if exception is None:
+                print(f"Event created: {title}")
+                created_events.append(title)
+            elif _is_retryable(exception):
+                retry_inserts.append(chunk[int(request_id)])
+            else:
+                print(f"Failed to create event {title}: {str(exception)}")
+                skipped_events.append(f"{title} (creation failed)")
+        
+        batch = service.new_batch_http_request(callback=on_insert)
+        for i, (title, calendar_event) in enumerate(chunk):
+            batch.add(service.events().insert(calendarId=calendar_id, body=calendar_event), request_id=str(i))
+        
+        try:
+            batch.execute()
+        except Exception as e:
+            print(f"Batch insert failed, retrying individually: {str(e)}")
+            retry_inserts.extend(chunk)
+    
+    if retry_inserts:
+        progress(f"Retrying {len(retry_inserts)} events...")
+        results = _execute_individually({
+            i: service.events().insert(calendarId=calendar_id, body=calendar_event)
+            for i, (title, calendar_event) in enumerate(retry_inserts)
+        })
+        # Report in the original order rather than completion order
+        for i, (title, calendar_event) in enumerate(retry_inserts):
+            exception = results[i][1]
+            # 409 Conflict means an earlier attempt with this id did go through
+            if exception is None or _http_status(exception) == 409:
+                print(f"Event created: {title}")
+                created_events.append(title)
+            else:
+                print(f"Failed to create event {title}: {str(exception)}")
+                skipped_events.append(f"{title} (creation failed)")
+
+def _build_calendar_body(event, timezone, reminders):
+    """Build the Calendar API body for a scraped event with valid start/end times"""
+    start_time = event['start_time']
+    end_time = event['end_time']
+    title = event.get('title', 'Unnamed Event')
+    event_type = event.get('event_type', 'General')
+    bonus = event.get('bonus')
+    event_link = event.get('event_link', 'https://leekduck.com/events/')
+    
+    # Determine if this is a multi-day event and if it should be all-day
+    is_multi_day = event.get('is_multi_day', False)
+    
+    # Calculate if this should be an all-day event
+    # Criteria: multi-day event with time at or near beginning/end of day
+    start_near_day_start = start_time.hour < 2  # Before 2 AM
+    end_near_day_end = end_time.hour > 21  # After 9 PM
+    is_all_day = is_multi_day and start_near_day_start and end_near_day_end
+    
+    # Check if this is a day-long event (starting early and ending late)
+    is_day_long = (
+        not is_multi_day and 
+        start_time.hour < 10 and
+        end_time.hour > 18 and
+        (end_time - start_time).seconds > 7 * 3600  # more than 7 hours
+    )
+    
+    # Day-long events should also be treated as all-day
+    is_all_day = is_all_day or is_day_long
+    
+    # Modify the title for Spotlight events to include the bonus
+    event_title = title
+    if event_type == "Spotlight" and bonus:
+        event_title = f"{event_title} ({bonus})"
+    
+    # Description: summary text, then source/image links, then type and bonus
+    description_parts = [event.get('description') or 'Pokémon GO event', "", f"Source: {event_link}"]
+    image_url = event.get('image_url')
+    if image_url:
+        description_parts.append(f"Image: {image_url}")
+    description_parts += ["", f"Event Type: {event_type}"]
+    if event_type == "Spotlight" and bonus:
+        description_parts.append(f"Bonus: {bonus}")
+    
+    calendar_event = {
+        'summary': event_title,
+        'description': "\n".join(description_parts),
+        'reminders': {
+            'useDefault': False,
+            'overrides': reminders,
+        },
+    }
+    
+    if is_all_day:
+        # Use date format for all-day events
+        calendar_event['start'] = {
+            'date': start_time.date().isoformat(),
+        }
+        # For all-day events, end date should be the day after the last day
+        end_date = end_time.date() + datetime.timedelta(days=1)
+        calendar_event['end'] = {
+            'date': end_date.isoformat(),
+        }
+        print(f"Creating all-day event from {start_time.date()} to {end_date}")
+    else:
+        # Use dateTime format for timed events
+        calendar_event['start'] = {
+            'dateTime': start_time.isoformat(),
+            'timeZone': timezone,
+        }
+        calendar_event['end'] = {
+            'dateTime': end_time.isoformat(),
+            'timeZone': timezone,
+        }
+    
+    return calendar_event
+
+def _call_directly(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+def create_calendar_events_direct(selected_events, ui_call=_call_directly, progress=_no_progress,
+                                  cancel=None):
+    """Create Google Calendar events with improved update handling
+    
+    Dialogs are shown through ui_call(func, *args), so a caller running this
+    off the Tk main thread can marshal them back onto it. progress(text) is
+    called with short status updates as the work advances. Setting the cancel
+    event (a threading.Event) stops before the next event or insert batch; an
+    update whose old event was already deleted is always completed. The caller
+    must keep the process alive until this returns for that to hold.
+    """
     if not selected_events:
         print("No events to add to calendar")
         return []
@@ -603,6 +1335,7 @@ def create_calendar_events_direct(selected_events):
     created_events = []
     updated_events = []
     skipped_events = []
+    pending_inserts = []
     
     try:
         service, calendar_id = get_calendar_service()
@@ -619,163 +1352,103 @@ def create_calendar_events_direct(selected_events):
         ])
         
         # Get existing events to check for duplicates and potential updates
-        existing_events = get_existing_events(service, calendar_id)
+        progress("Checking existing events...")
+        existing_events = get_existing_events(service, calendar_id, *_selected_events_range(selected_events))
+        existing_keys = get_existing_event_keys(existing_events)
+        existing_by_date = group_existing_events_by_date(existing_events)
+        existing_content_keys = {calendar_event_content_key(existing) for existing in existing_events}
         print(f"Found {len(existing_events)} existing events in calendar")
         
         for event in selected_events:
+            # Bind the fields used below once per event
+            start_time = event.get('start_time')
+            end_time = event.get('end_time')
+            title = event.get('title', 'Unnamed Event')
+            
+            if cancel is not None and cancel.is_set():
+                skipped_events.append(f"{title} (cancelled)")
+                continue
+            
             # Skip events with unparseable dates
-            if not event.get('start_time') or not event.get('end_time'):
-                print(f"Skipping event with unparseable dates: {event.get('title')}")
-                skipped_events.append(f"{event.get('title')} (invalid dates)")
+            if not start_time or not end_time:
+                print(f"Skipping event with unparseable dates: {title}")
+                skipped_events.append(f"{title} (invalid dates)")
                 continue
             
             # Check if event already exists or needs updating
-            event_exists = False
             update_existing = False
+            replaces = None
             existing_event_id = None
             existing_event_title = None
-            event_start_iso = event.get('start_time').isoformat()
-            event_start_date = event.get('start_time').date()
+            event_start_date = start_time.date()
             
-            # First look for exact matches or similar events
-            for existing in existing_events:
-                # Get existing event start time
-                existing_start = None
-                existing_date = None
-                
-                if existing.get('start', {}).get('dateTime'):
-                    existing_start = existing.get('start', {}).get('dateTime')
-                    # Extract date from ISO format
-                    existing_date = datetime.datetime.fromisoformat(
-                        existing_start.replace('Z', '+00:00') if existing_start.endswith('Z') 
-                        else existing_start
-                    ).date()
-                elif existing.get('start', {}).get('date'):
-                    # For all-day events
-                    existing_date = datetime.datetime.strptime(
-                        existing.get('start', {}).get('date'), '%Y-%m-%d'
-                    ).date()
-                
-                if not existing_date:
-                    continue
-                
-                # Case 1: Exact duplicate - same title and time
-                if (existing.get('summary') == event.get('title') and 
-                    existing_date == event_start_date):
-                    event_exists = True
-                    break
-                
-                # Case 2: Same event on same date but with updated details
-                if existing_date == event_start_date:
-                    # Check if it's the same type of event or a similar title
-                    if (is_same_event_type(existing.get('summary', ''), event.get('title', '')) or 
-                        is_similar_title(existing.get('summary', ''), event.get('title', ''))):
-                        update_existing = True
-                        existing_event_id = existing.get('id')
-                        existing_event_title = existing.get('summary')
-                        break
+            # Case 1: Exact duplicate - same title and date
+            if (title, event_start_date) in existing_keys:
+                print(f"Event already exists: {title}")
+                skipped_events.append(f"{title} (already exists)")
+                continue
             
-            if event_exists:
-                print(f"Event already exists: {event.get('title')}")
-                skipped_events.append(f"{event.get('title')} (already exists)")
+            # An identical copy (e.g. a Spotlight title with its bonus) needs no update
+            calendar_event = _build_calendar_body(event, timezone, reminders)
+            if calendar_event_content_key(calendar_event) in existing_content_keys:
+                print(f"Event unchanged: {title}")
+                skipped_events.append(f"{title} (unchanged)")
                 continue
             
+            # Case 2: Same event on same date but with updated details
+            for existing_summary, existing_id in existing_by_date.get(event_start_date, ()):
+                # Check if it's the same type of event or a similar title
+                if (is_same_event_type(existing_summary, title) or 
+                    is_similar_title(existing_summary, title)):
+                    update_existing = True
+                    existing_event_id = existing_id
+                    existing_event_title = existing_summary
+                    break
+            
             # If we're updating an existing event, ask for confirmation
             if update_existing and existing_event_id:
-                if messagebox.askyesno(
+                if ui_call(
+                    messagebox.askyesno,
                     "Update Event?", 
                     f"An existing event '{existing_event_title}' " +
-                    f"was found on the same date as '{event.get('title')}'.\n\n" +
+                    f"was found on the same date as '{title}'.\n\n" +
                     f"Would you like to update it with the new information?"
                 ):
-                    # Delete the old event first
-                    try:
-                        service.events().delete(
-                            calendarId=calendar_id, 
-                            eventId=existing_event_id
-                        ).execute()
-                        print(f"Deleted old event: {existing_event_title}")
-                        updated_events.append((existing_event_title, event.get('title')))
-                    except Exception as e:
-                        print(f"Failed to delete old event: {str(e)}")
-                        skipped_events.append(f"{event.get('title')} (update failed)")
-                        continue
+                    # The old event is deleted in a batch below, before the new one is inserted
+                    replaces = (existing_event_id, existing_event_title)
                 else:
                     # User chose not to update
-                    skipped_events.append(f"{event.get('title')} (update declined)")
+                    skipped_events.append(f"{title} (update declined)")
                     continue
             
-            # Create event
-            event_link = event.get('event_link', 'https://leekduck.com/events/')
-            
-            # Determine if this is a multi-day event and if it should be all-day
-            is_multi_day = event.get('is_multi_day', False)
-            
-            # Calculate if this should be an all-day event
-            # Criteria: multi-day event with time at or near beginning/end of day
-            start_near_day_start = event.get('start_time').hour < 2  # Before 2 AM
-            end_near_day_end = event.get('end_time').hour > 21  # After 9 PM
-            is_all_day = is_multi_day and start_near_day_start and end_near_day_end
-            
-            # Check if this is a day-long event (starting early and ending late)
-            is_day_long = (
-                not is_multi_day and 
-                event.get('start_time').hour < 10 and
-                event.get('end_time').hour > 18 and
-                (event.get('end_time') - event.get('start_time')).seconds > 7 * 3600  # more than 7 hours
-            )
-            
-            # Day-long events should also be treated as all-day
-            is_all_day = is_all_day or is_day_long
-            
-            # Modify the title for Spotlight events to include the bonus
-            event_title = event.get('title', 'Unnamed Event')
-            if event.get('event_type') == "Spotlight" and event.get('bonus'):
-                event_title = f"{event_title} ({event.get('bonus')})"
-            
-            calendar_event = {
-                'summary': event_title,
-                'description': (event.get('description', '') or 'Pokémon GO event') + 
-                              f"\n\nSource: {event_link}" + 
-                              (f"\nImage: {event.get('image_url', '')}" if event.get('image_url') else "") +
-                              f"\n\nEvent Type: {event.get('event_type', 'General')}" +
-                              (f"\nBonus: {event.get('bonus')}" if event.get('event_type') == "Spotlight" and event.get('bonus') else ""),
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': reminders,
-                },
-            }
-            
-            if is_all_day:
-                # Use date format for all-day events
-                calendar_event['start'] = {
-                    'date': event.get('start_time').date().isoformat(),
-                }
-                # For all-day events, end date should be the day after the last day
-                end_date = event.get('end_time').date() + datetime.timedelta(days=1)
-                calendar_event['end'] = {
-                    'date': end_date.isoformat(),
-                }
-                print(f"Creating all-day event from {event.get('start_time').date()} to {end_date}")
+            # Queue the insert; they are sent together in batch requests below
+            pending_inserts.append((title, calendar_event, replaces))
+        
+        # Delete the events being updated, then insert everything whose old copy is gone
+        # (an old event matched by more than one new event is only deleted once)
+        if cancel is not None and cancel.is_set():
+            skipped_events.extend(f"{title} (cancelled)" for title, _, _ in pending_inserts)
+            pending_inserts = []
+        pending_deletes = list(dict.fromkeys(replaces for _, _, replaces in pending_inserts if replaces))
+        if pending_deletes:
+            progress(f"Removing {len(pending_deletes)} outdated events...")
+        failed_deletes = delete_events_batched(service, calendar_id, pending_deletes)
+        replacement_inserts = []
+        new_inserts = []
+        for title, calendar_event, replaces in pending_inserts:
+            if replaces:
+                if replaces[0] in failed_deletes:
+                    skipped_events.append(f"{title} (update failed)")
+                    continue
+                updated_events.append((replaces[1], title))
+                replacement_inserts.append((title, calendar_event))
             else:
-                # Use dateTime format for timed events
-                calendar_event['start'] = {
-                    'dateTime': event.get('start_time').isoformat(),
-                    'timeZone': timezone,
-                }
-                calendar_event['end'] = {
-                    'dateTime': event.get('end_time').isoformat(),
-                    'timeZone': timezone,
-                }
-            
-            # Insert event
-            try:
-                created_event = service.events().insert(calendarId=calendar_id, body=calendar_event).execute()
-                print(f"Event created: {event.get('title')}")
-                created_events.append(event.get('title'))
-            except Exception as e:
-                print(f"Failed to create event {event.get('title')}: {str(e)}")
-                skipped_events.append(f"{event.get('title')} (creation failed)")
+                new_inserts.append((title, calendar_event))
+        
+        # Replacements go first and ignore cancel, so an update never stops half-done
+        insert_events_batched(service, calendar_id, replacement_inserts, created_events, skipped_events, progress)
+        insert_events_batched(service, calendar_id, new_inserts, created_events, skipped_events, progress, cancel)
+        progress("Cancelled" if cancel is not None and cancel.is_set() else "Done")
         
         # Prepare final message
         message_parts = []
@@ -793,49 +1466,96 @@ def create_calendar_events_direct(selected_events):
                                 "\n".join([f"• {event}" for event in skipped_events]))
         
         if not message_parts:
-            messagebox.showinfo("No Events Added", "No new events were added to the calendar.")
+            ui_call(messagebox.showinfo, "No Events Added", "No new events were added to the calendar.")
         else:
-            messagebox.showinfo("Calendar Update Results", "\n\n".join(message_parts))
+            ui_call(messagebox.showinfo, "Calendar Update Results", "\n\n".join(message_parts))
+        
+        # The listing no longer reflects the calendar
+        _EXISTING_EVENTS_CACHE.pop(calendar_id, None)
         
         return created_events
     except Exception as e:
         print(f"Error creating calendar events: {str(e)}")
-        messagebox.showerror("Error", f"Failed to update calendar: {str(e)}")
+        ui_call(messagebox.showerror, "Error", f"Failed to update calendar: {str(e)}")
         return []
 
+_STYLES_INITIALIZED = False
+
+def _configure_styles():
+    """Configure the ttk styles used by the UI, once per run"""
+    global _STYLES_INITIALIZED
+    if _STYLES_INITIALIZED:
+        return
+    style = ttk.Style()
+    style.configure("Card.TFrame", relief="solid", borderwidth=1)
+    style.configure("Title.TLabel", font=("Helvetica", 11, "bold"))
+    style.configure("Date.TLabel", font=("Helvetica", 9))
+    style.configure("Time.TLabel", font=("Helvetica", 9, "bold"))
+    style.configure("Type.TLabel", font=("Helvetica", 9), foreground="white")
+    style.configure("DateHeader.TLabel", font=("Helvetica", 12, "bold"), foreground="#1976D2")
+    style.configure("FilterCheckbutton.TCheckbutton", font=("Helvetica", 9))
+    style.configure("Accent.TButton", font=("Helvetica", 10, "bold"))
+    _STYLES_INITIALIZED = True
+
 class EventConfirmationUI:
+    # Row geometry (pixels) for the virtualized event list; row heights are
+    # derived from these and the font metrics in _measure_row_geometry
+    HEADER_GAP = 10
+    CARD_PADDING = 5
+    CARD_BOTTOM_MARGIN = 12
+    TITLE_WIDTH = 800  # Card titles wrap at this width
+    STRIPE_WIDTH = 5
+    DIVIDER_COLOR = "#B0B0B0"
+    # Filter toggles within this window are applied together
+    FILTER_DEBOUNCE_MS = 50
+    # Wheel events on Windows/macOS, and the button events X11 sends instead
+    WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+    
     def __init__(self, root, events):
         self.root = root
         self.events = events
         self.selected_indices = []
-        self.var_checkboxes = []
-        self.event_frames = []  # Store references to event frames with metadata
+        self._rows = []  # (event, checkbox var, event type) for every displayed event
+        self.event_frames = []  # Row metadata for every displayed event
+        self.date_sections = []
+        self.visible_rows = []
+        self.row_offsets = []
+        self.total_height = 0
+        
+        # Recycled row widgets for the virtualized list
+        self._header_pool = []
+        self._card_pool = []
+        self._row_tag_count = 0
+        self._render_pending = None
+        self._filter_pending = None
+        
+        # Submission worker, the UI calls it hands back to the main thread,
+        # and the event the Cancel button sets to stop it early
+        self._worker = None
+        self._ui_calls = queue.Queue()
+        self._cancel_submit = threading.Event()
+        
+        # Mouse wheel deltas accumulated between scroll frames
+        self._wheel_delta = 0
+        self._wheel_pending = None
         
         # Load config
         self.config = load_config()
         self.app_config = self.config.get("app", {})
         
         # Get all unique event types
-        all_event_types = set(event.get('event_type', 'General') for event in events)
-        self.event_types = sorted(list(all_event_types))
+        self.event_types = sorted({event.get('event_type', 'General') for event in events})
         
         # Load color configuration
-        self.type_colors = self.config.get("event_colors", {
-            "Raid": "#E57373",        # Light Red
-            "Community Day": "#81C784", # Light Green
-            "Spotlight": "#64B5F6",    # Light Blue
-            "Battle": "#FFB74D",       # Light Orange
-            "Hatch Day": "#9575CD",    # Light Purple
-            "Mega": "#FF8A65",         # Light Deep Orange
-            "General": "#B0BEC5",      # Light Blue Grey
-            "Ticket": "#4DB6AC",       # Light Teal
-            "Shadow": "#9E9E9E"        # Light Grey
-        })
+        self.type_colors = self.config.get("event_colors", DEFAULT_EVENT_COLORS)
+        # Resolved color per event type present, so cards never fall back per bind
+        self._color_for = {t: self.type_colors.get(t, "#B0BEC5") for t in self.event_types}
         
-        # Configure filter variables
-        self.filter_vars = {}
-        for event_type in self.event_types:
-            self.filter_vars[event_type] = tk.BooleanVar(value=True)
+        # Configure filter variables for the types actually present
+        self.filter_vars = {event_type: tk.BooleanVar(value=True) for event_type in self.event_types}
+        
+        # Sort and group the events once; display_events only builds rows from this
+        self._prepare_groups()
         
         self.setup_ui()
         
@@ -847,14 +1567,8 @@ class EventConfirmationUI:
         self.root.geometry(window_size)
         
         # Configure style
-        style = ttk.Style()
-        style.configure("Card.TFrame", relief="solid", borderwidth=1)
-        style.configure("Title.TLabel", font=("Helvetica", 11, "bold"))
-        style.configure("Date.TLabel", font=("Helvetica", 9))
-        style.configure("Time.TLabel", font=("Helvetica", 9, "bold"))
-        style.configure("Type.TLabel", font=("Helvetica", 9), foreground="white")
-        style.configure("DateHeader.TLabel", font=("Helvetica", 12, "bold"), foreground="#1976D2")
-        style.configure("FilterCheckbutton.TCheckbutton", font=("Helvetica", 9))
+        _configure_styles()
+        self._label_options = self._resolve_label_styles()
         
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
@@ -882,19 +1596,22 @@ class EventConfirmationUI:
         btn_frame = ttk.Frame(top_frame)
         btn_frame.pack(side="right")
         
+        # Submission progress, shown to the left of the buttons
+        self.status_var = tk.StringVar()
+        ttk.Label(top_frame, textvariable=self.status_var, style="Date.TLabel").pack(side="right", padx=10)
+        
         # Cancel button
-        cancel_btn = ttk.Button(btn_frame, text="Cancel", command=self.root.destroy)
-        cancel_btn.pack(side="left", padx=5)
+        self.cancel_btn = ttk.Button(btn_frame, text="Cancel", command=self.root.destroy)
+        self.cancel_btn.pack(side="left", padx=5)
         
         # Submit button
-        submit_btn = ttk.Button(
+        self.submit_btn = ttk.Button(
             btn_frame, 
             text="Add Selected Events to Calendar", 
             command=self.submit,
             style="Accent.TButton"
         )
-        style.configure("Accent.TButton", font=("Helvetica", 10, "bold"))
-        submit_btn.pack(side="left", padx=5)
+        self.submit_btn.pack(side="left", padx=5)
         
         # Filters labelframe (similar to your screenshot)
         filters_labelframe = ttk.LabelFrame(main_frame, text="Filter by Event Type", padding=(5, 5))
@@ -906,7 +1623,7 @@ class EventConfirmationUI:
         
         # Create filter checkboxes in a horizontal row (like in your screenshot)
         for i, event_type in enumerate(self.event_types):
-            color = self.type_colors.get(event_type, "#B0BEC5")
+            color = self._color_for[event_type]
             
             # Create a frame for the filter
             filter_item = ttk.Frame(filters_frame)
@@ -926,238 +1643,514 @@ class EventConfirmationUI:
             )
             cb.pack(side="left")
         
-        # Create scrollable frame for events
+        # Create virtualized event list: only rows inside the viewport get widgets
         canvas_frame = ttk.Frame(main_frame)
         canvas_frame.pack(fill="both", expand=True)
         
-        self.canvas = tk.Canvas(canvas_frame, borderwidth=0, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.canvas = tk.Canvas(
+            canvas_frame,
+            borderwidth=0,
+            highlightthickness=0,
+            background=ttk.Style().lookup("TFrame", "background")
         )
-        
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self._on_scroll)
         self.canvas.configure(yscrollcommand=scrollbar.set)
         
+        # Re-render when the canvas is resized (window resize or first map)
+        self.canvas.bind("<Configure>", lambda e: self._schedule_render())
+        
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Bind mouse wheel to scroll
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Bind mouse wheel to scroll only while the pointer is over the list
+        self.canvas.bind("<Enter>", self._bind_mousewheel)
+        self.canvas.bind("<Leave>", self._unbind_mousewheel)
+        self.canvas.bind("<Destroy>", self._on_destroy)
         
-        # Add events to scrollable frame
+        # Build the row model for the event list
+        self._measure_row_geometry()
         self.display_events()
     
+    def _resolve_label_styles(self):
+        """Look up the list's text styles once so pooled rows can draw canvas text"""
+        style = ttk.Style()
+        default_fg = style.lookup("TLabel", "foreground") or "black"
+        
+        options = {}
+        for name in ("Title.TLabel", "Date.TLabel", "DateHeader.TLabel"):
+            options[name] = {
+                'font': style.lookup(name, "font"),
+                'foreground': style.lookup(name, "foreground") or default_fg
+            }
+        return options
+    
+    def _on_scroll(self, *args):
+        """Handle scrollbar movement"""
+        self.canvas.yview(*args)
+        self._render_visible()
+    
+    def _bind_mousewheel(self, event=None):
+        for sequence in self.WHEEL_SEQUENCES:
+            self.canvas.bind_all(sequence, self._on_mousewheel)
+    
+    def _unbind_wheel_sequences(self):
+        for sequence in self.WHEEL_SEQUENCES:
+            self.canvas.unbind_all(sequence)
+    
+    def _unbind_mousewheel(self, event):
+        # Moving onto a card inside the canvas also fires <Leave>; keep the binding then
+        widget = self.canvas.winfo_containing(event.x_root, event.y_root)
+        if widget is None or not str(widget).startswith(str(self.canvas)):
+            self._unbind_wheel_sequences()
+    
+    def _on_destroy(self, event):
+        """Drop the global wheel bindings and pending callbacks with the list"""
+        self._unbind_wheel_sequences()
+        for pending in (self._wheel_pending, self._render_pending, self._filter_pending):
+            if pending is not None:
+                self.root.after_cancel(pending)
+        self._wheel_pending = self._render_pending = self._filter_pending = None
+    
     def _on_mousewheel(self, event):
-        """Handle mouse wheel scrolling"""
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        """Handle mouse wheel scrolling, applying accumulated ticks once per frame"""
+        # X11 reports the wheel as buttons 4 (up) and 5 (down) with no delta
+        if event.num == 4:
+            self._wheel_delta += 120
+        elif event.num == 5:
+            self._wheel_delta -= 120
+        else:
+            self._wheel_delta += event.delta
+        if self._wheel_pending is None:
+            self._wheel_pending = self.root.after(16, self._flush_wheel)
+    
+    def _flush_wheel(self):
+        self._wheel_pending = None
+        units = int(-self._wheel_delta / 120)
+        # Keep any partial tick so small trackpad deltas still add up
+        self._wheel_delta += units * 120
+        if units:
+            self.canvas.yview_scroll(units, "units")
+            self._render_visible()
+    
+    def _prepare_groups(self):
+        """Sort the events by start time and group them by date, once per window"""
+        # Undated events have no section to go in. The date key is computed once
+        # per event and the sort/group keys are C-level itemgetters rather than lambdas
+        dated_events = sorted(
+            ((event['start_time'].strftime('%Y-%m-%d'), event['start_time'], event)
+             for event in self.events if event.get('start_time')),
+            key=operator.itemgetter(1)
+        )
+        
+        # Chronological order means each date's events are already contiguous.
+        # Each entry is (date key, header text, events on that date)
+        self._date_groups = []
+        for date_key, group in itertools.groupby(dated_events, key=operator.itemgetter(0)):
+            group = [event for _, _, event in group]
+            date_text = group[0]['start_time'].strftime('%A, %B %d, %Y')
+            self._date_groups.append((date_key, date_text, group))
     
     def display_events(self):
-        """Display events in the scrollable frame with improved formatting"""
-        # Sort events by date
-        sorted_events = sorted(self.events, key=lambda e: e.get('start_time') if e.get('start_time') else datetime.datetime.max)
-        
-        # Group events by date
-        date_groups = {}
-        for event in sorted_events:
-            if event.get('start_time'):
-                date_key = event['start_time'].strftime('%Y-%m-%d')
-                if date_key not in date_groups:
-                    date_groups[date_key] = []
-                date_groups[date_key].append(event)
-        
-        # Store frame references for each date section
-        self.date_frames = {}
-        
-        # Clear existing event frames list
+        """Build the date sections and event rows shown in the virtualized list"""
+        # Clear existing rows; checkbox state lives in the rows, not in widgets
+        self.date_sections = []
         self.event_frames = []
-        self.var_checkboxes = []
+        self._rows = []
         
-        # Display events grouped by date
-        for date_key in sorted(date_groups.keys()):
+        # Indexes used by apply_filters to touch only the rows of toggled types
+        self._rows_by_type = collections.defaultdict(list)
+        self._visible_counts = {}
+        self._active_types = set(self.event_types)
+        
+        for date_key, date_text, group in self._date_groups:
             # Create date header with more readable format
-            sample_date = date_groups[date_key][0]['start_time']
-            date_str = sample_date.strftime('%A, %B %d, %Y')
-            date_frame = ttk.Frame(self.scrollable_frame)
-            date_frame.pack(fill="x", pady=(10, 0))
-            self.date_frames[date_key] = date_frame
-            
-            date_header = ttk.Label(
-                date_frame, 
-                text=date_str,
-                style="DateHeader.TLabel"
-            )
-            date_header.pack(fill="x", padx=5, pady=(5, 3), anchor="w")
-            
-            # Add separator after date header
-            ttk.Separator(date_frame, orient="horizontal").pack(fill="x", padx=5, pady=(0, 5))
+            section = {
+                'kind': 'header',
+                'date_key': date_key,
+                'text': date_text,
+                'events': [],
+                'visible': True
+            }
+            self.date_sections.append(section)
             
-            # Create a frame for the events in this date
-            events_frame = ttk.Frame(date_frame)
-            events_frame.pack(fill="x", padx=5, pady=5)
+            for event in group:
+                # Store row metadata used for rendering and filtering
+                event_type = event.get('event_type', 'General')
+                var_cb = tk.BooleanVar(value=True)
+                frame_data = {
+                    'kind': 'event',
+                    'type': event_type,
+                    'date_key': date_key,
+                    'visible': True,
+                    'var': var_cb
+                }
+                frame_data.update(self._display_strings(event))
+                frame_data['title_height'] = self._measure_title(frame_data['title_text'])
+                frame_data['height'] = self._card_height(frame_data)
+                self._rows.append((event, var_cb, event_type))
+                self.event_frames.append(frame_data)
+                section['events'].append(frame_data)
+                self._rows_by_type[frame_data['type']].append(frame_data)
             
-            # Display events for this date in a single column as in your screenshot
-            for event in date_groups[date_key]:
-                # Create event card
-                event_frame = self.create_event_card(events_frame, event)
-                event_frame.pack(fill="x", padx=5, pady=5)
-    
-    def create_event_card(self, parent, event):
-        event_frame = ttk.Frame(parent, padding=(0, 0, 0, 0), style="Card.TFrame")
-        
-        # Store reference to event frame with metadata AND the actual event object
-        frame_data = {
-            'frame': event_frame,
-            'type': event.get('event_type', 'General'),
-            'date_key': event['start_time'].strftime('%Y-%m-%d') if event.get('start_time') else None,
-            'original_index': event.get('original_index'),
-            'event_object': event  # Store direct reference to the event object itself
-        }
-        self.event_frames.append(frame_data)
-        
-        # Configure background color based on event type
-        bg_color = self.type_colors.get(event.get('event_type', 'General'), "#B0BEC5")
-        
-        # Create type indicator (left vertical bar)
-        type_frame = tk.Frame(event_frame, background=bg_color, width=5)
-        type_frame.pack(side="left", fill="y")
+            self._visible_counts[date_key] = len(section['events'])
         
-        # Create content frame
-        content_frame = ttk.Frame(event_frame, padding=(10, 5))
-        content_frame.pack(side="left", fill="both", expand=True)
-        
-        # Create checkbox with the frame data attached
-        var_cb = tk.BooleanVar(value=True)
-        var_cb.frame_data = frame_data  # Store direct reference to frame data
-        self.var_checkboxes.append(var_cb)
+        self._layout()
+    
+    def _measure_row_geometry(self):
+        """Size rows from the actual font metrics, so they fit at any Tk scaling"""
+        def linespace(style_name):
+            font = self._label_options[style_name]['font'] or "TkDefaultFont"
+            return tk.font.Font(font=font).metrics("linespace")
+        
+        self._info_line_height = linespace("Date.TLabel")
+        self._title_line_height = linespace("Title.TLabel")
+        # Gap, date label, space above the separator, then space below it
+        self._header_height = self.HEADER_GAP + 5 + linespace("DateHeader.TLabel") + 10 + 6
+        
+        probe = ttk.Checkbutton(self.canvas)
+        self._checkbox_height = probe.winfo_reqheight()
+        probe.destroy()
+        
+        # Off-screen text item that wraps like a card title, used to measure titles
+        title_options = self._label_options["Title.TLabel"]
+        self._title_probe = self.canvas.create_text(
+            -10000, -10000, anchor="nw", width=self.TITLE_WIDTH, font=title_options['font']
+        )
+    
+    def _measure_title(self, text):
+        """Return the height of a card title once Tk has wrapped it to TITLE_WIDTH"""
+        self.canvas.itemconfigure(self._title_probe, text=text)
+        bbox = self.canvas.bbox(self._title_probe)
+        if not bbox:  # Empty titles have no bounding box
+            return self._title_line_height
+        return bbox[3] - bbox[1]
+    
+    def _card_height(self, row):
+        """Return the height of an event row: title, info lines, margins and padding"""
+        info_lines = row['info_text'].count("\n") + 1
+        content = max(row['title_height'] + info_lines * self._info_line_height, self._checkbox_height)
+        return 6 + content + self.CARD_BOTTOM_MARGIN + 2 * self.CARD_PADDING
+    
+    def _row_height(self, row):
+        """Return the pixel height reserved for a row, including its padding"""
+        if row['kind'] == 'header':
+            return self._header_height
+        return row['height']
+    
+    def _layout(self):
+        """Compute the y offset of every visible row and update the scroll region"""
+        self.visible_rows = []
+        self.row_offsets = []
+        y = 0
+        for section in self.date_sections:
+            if not section['visible']:
+                continue
+            for row in [section] + section['events']:
+                if row['visible']:
+                    row['y'] = y
+                    self.visible_rows.append(row)
+                    self.row_offsets.append(y)
+                    y += self._row_height(row)
+        
+        self.total_height = y
+        self.canvas.configure(scrollregion=(0, 0, 0, y))
+        self._schedule_render()
+    
+    def _schedule_render(self):
+        """Coalesce bursts of resize/layout events into one render when Tk is idle"""
+        if self._render_pending is None:
+            self._render_pending = self.root.after_idle(self._do_render)
+    
+    def _do_render(self):
+        self._render_pending = None
+        self._render_visible()
+    
+    def _render_visible(self):
+        """Place pooled row items over the rows that intersect the viewport"""
+        canvas = self.canvas
+        top = canvas.canvasy(0)
+        bottom = top + canvas.winfo_height()
+        width = canvas.winfo_width()
+        
+        row_offsets = self.row_offsets
+        visible_rows = self.visible_rows
+        first = max(bisect.bisect_right(row_offsets, top) - 1, 0)
+        last = bisect.bisect_left(row_offsets, bottom)
+        
+        # Hoisted out of the per-row loop below
+        header_pool = self._header_pool
+        card_pool = self._card_pool
+        itemconfigure = canvas.itemconfigure
+        headers_used = cards_used = 0
+        
+        for index in range(first, last):
+            row = visible_rows[index]
+            y = row_offsets[index]
+            if row['kind'] == 'header':
+                if headers_used == len(header_pool):
+                    header_pool.append(self.create_header_widget())
+                widget = header_pool[headers_used]
+                headers_used += 1
+                # Only reconfigure a recycled row when it shows a different row
+                if widget['row'] is not row:
+                    widget['row'] = row
+                    itemconfigure(widget['label'], text=row['text'])
+                itemconfigure(widget['tag'], state='normal')
+                self.place_header(widget, y, width)
+            else:
+                if cards_used == len(card_pool):
+                    card_pool.append(self.create_event_card())
+                widget = card_pool[cards_used]
+                cards_used += 1
+                if widget['row'] is not row:
+                    widget['row'] = row
+                    self.bind_event_card(widget, row)
+                itemconfigure(widget['tag'], state='normal')
+                self.place_event_card(widget, row, y, width)
+        
+        # Hide pooled rows that aren't needed for this viewport
+        for widget in header_pool[headers_used:] + card_pool[cards_used:]:
+            itemconfigure(widget['tag'], state='hidden')
+    
+    def _new_row_tag(self):
+        """Return a unique canvas tag grouping the items of one pooled row"""
+        self._row_tag_count += 1
+        return f"row{self._row_tag_count}"
+    
+    def create_header_widget(self):
+        """Create a pooled date header row drawn directly on the canvas"""
+        tag = self._new_row_tag()
+        options = self._label_options["DateHeader.TLabel"]
+        label = self.canvas.create_text(
+            0, 0, anchor="nw", font=options['font'], fill=options['foreground'],
+            tags=(tag,), state='hidden'
+        )
         
-        # Checkbox and Title row
-        top_row = ttk.Frame(content_frame)
-        top_row.pack(fill="x", anchor="w")
+        # Add separator after date header
+        separator = self.canvas.create_line(0, 0, 0, 0, fill=self.DIVIDER_COLOR, tags=(tag,), state='hidden')
+        return {'tag': tag, 'label': label, 'separator': separator, 'row': None}
+    
+    def place_header(self, header, y, width):
+        canvas = self.canvas
+        canvas.coords(header['label'], 5, y + self.HEADER_GAP + 5)
+        separator_y = y + self._header_height - 6
+        canvas.coords(header['separator'], 5, separator_y, max(width - 5, 5), separator_y)
+    
+    def create_event_card(self):
+        """Create a pooled event card; bind_event_card fills it for a given row
+        
+        Text, border and type stripe are canvas items; only the checkbox is a
+        real widget, embedded with create_window.
+        """
+        canvas = self.canvas
+        tag = self._new_row_tag()
+        
+        # Type indicator (left vertical bar) and card border
+        stripe = canvas.create_rectangle(0, 0, 0, 0, outline="", tags=(tag,), state='hidden')
+        border = canvas.create_rectangle(0, 0, 0, 0, outline=self.DIVIDER_COLOR, tags=(tag,), state='hidden')
+        
+        cb = ttk.Checkbutton(canvas)
+        window = canvas.create_window(0, 0, window=cb, anchor="nw", tags=(tag,), state='hidden')
+        
+        title_options = self._label_options["Title.TLabel"]
+        title = canvas.create_text(
+            0, 0, anchor="nw", width=self.TITLE_WIDTH, font=title_options['font'],
+            fill=title_options['foreground'], tags=(tag,), state='hidden'
+        )
         
-        cb = ttk.Checkbutton(
-            top_row, 
-            variable=var_cb
+        # Date, time, type and bonus lines share one multi-line text item
+        info_options = self._label_options["Date.TLabel"]
+        info = canvas.create_text(
+            0, 0, anchor="nw", font=info_options['font'],
+            fill=info_options['foreground'], tags=(tag,), state='hidden'
         )
-        cb.pack(side="left", anchor="nw")
+        
+        return {
+            'tag': tag,
+            'window': window,
+            'stripe': stripe,
+            'border': border,
+            'checkbox': cb,
+            'title': title,
+            'info': info,
+            'row': None
+        }
+    
+    def place_event_card(self, card, row, y, width):
+        canvas = self.canvas
+        pad = self.CARD_PADDING
+        top = y + pad
+        bottom = y + self._row_height(row) - pad
+        left = 2 * pad
+        card_left = left + self.STRIPE_WIDTH
+        canvas.coords(card['stripe'], left, top, card_left, bottom)
+        canvas.coords(card['border'], card_left, top, max(width - 2 * pad, card_left + 1), bottom)
+        
+        # Content is inset by the old card padding; the title follows the checkbox
+        content_x = card_left + 11
+        content_y = top + 6
+        canvas.coords(card['window'], content_x, content_y)
+        canvas.coords(card['title'], content_x + card['checkbox'].winfo_reqwidth(), content_y)
+        # Info starts below the title's measured (possibly wrapped) height
+        canvas.coords(card['info'], content_x + 18, content_y + row['title_height'])  # Align with checkbox
+    
+    def _display_strings(self, event):
+        """Format an event's card text once, so rendering never calls strftime"""
+        event_type = event.get('event_type', 'General')
+        bonus = event.get('bonus') if event_type == "Spotlight" else None
         
         # Title - Add bonus in parentheses for Spotlight events
         title_text = event.get('title', 'Unnamed Event')
-        if event.get('event_type') == "Spotlight" and event.get('bonus'):
-            title_text = f"{title_text} ({event.get('bonus')})"
-        
-        title = ttk.Label(
-            top_row,
-            text=title_text,
-            style="Title.TLabel",
-            wraplength=800
-        )
-        title.pack(side="left", anchor="nw", fill="x", expand=True)
-        
-        # Information rows
-        info_frame = ttk.Frame(content_frame)
-        info_frame.pack(fill="x", anchor="w")
-        
-        # Date row
-        if event.get('start_time'):
-            date_label = ttk.Label(
-                info_frame,
-                text=f"Date: {event['display_start']}",
-                style="Date.TLabel"
-            )
-            date_label.grid(row=0, column=0, sticky="w", padx=(18, 0))  # Align with checkbox
+        if bonus:
+            title_text = f"{title_text} ({bonus})"
         
         # Time row with proper format for multi-day events
-        if event.get('start_time') and event.get('end_time'):
-            if event.get('is_multi_day', False):
-                # Format for multi-day events - show full dates with times
-                start_str = event['start_time'].strftime('%b %d, %Y at %I:%M %p')
-                end_str = event['end_time'].strftime('%b %d, %Y at %I:%M %p')
-                time_text = f"Time: {start_str} to {end_str}"
-            else:
-                # Format for same-day events - just show the times
-                start_str = event['start_time'].strftime('%I:%M %p')
-                end_str = event['end_time'].strftime('%I:%M %p')
-                time_text = f"Time: {start_str} to {end_str}"
-                
-            time_label = ttk.Label(
-                info_frame,
-                text=time_text,
-                style="Time.TLabel"
-            )
-            time_label.grid(row=1, column=0, sticky="w", padx=(18, 0))
-        
-        # Type row
-        type_label = ttk.Label(
-            info_frame,
-            text=f"Type: {event.get('event_type', 'General')}",
-            style="Date.TLabel"
-        )
-        type_label.grid(row=2, column=0, sticky="w", padx=(18, 0))
-        
-        # Add Bonus row for Spotlight events
-        if event.get('event_type') == "Spotlight" and event.get('bonus'):
-            bonus_label = ttk.Label(
-                info_frame,
-                text=f"Bonus: {event.get('bonus')}",
-                style="Date.TLabel"
-            )
-            bonus_label.grid(row=3, column=0, sticky="w", padx=(18, 0))
-        
-        return event_frame
+        time_text = ""
+        start_time = event['start_time']
+        end_time = event.get('end_time')
+        if end_time:
+            # Multi-day events show full dates with times; same-day events just the times
+            time_format = '%b %d, %Y at %I:%M %p' if event.get('is_multi_day', False) else '%I:%M %p'
+            time_text = f"Time: {start_time.strftime(time_format)} to {end_time.strftime(time_format)}"
+        
+        # Bonus line only for Spotlight events
+        bonus_text = f"Bonus: {bonus}" if bonus else None
+        info_lines = [f"Date: {event['display_start']}", time_text, f"Type: {event_type}"]
+        if bonus_text:
+            info_lines.append(bonus_text)
+        
+        return {
+            'title_text': title_text,
+            'info_text': "\n".join(info_lines),
+            'bonus_text': bonus_text
+        }
+    
+    def bind_event_card(self, card, row):
+        """Show an event row's precomputed text in a pooled card"""
+        canvas = self.canvas
+        # Configure background color based on event type
+        canvas.itemconfigure(card['stripe'], fill=self._color_for[row['type']])
+        card['checkbox'].configure(variable=row['var'])
+        canvas.itemconfigure(card['title'], text=row['title_text'])
+        canvas.itemconfigure(card['info'], text=row['info_text'])
     
     def toggle_all(self, state):
-        for var in self.var_checkboxes:
+        for _, var, _ in self._rows:
             var.set(state)
     
     def apply_filters(self):
+        """Schedule a filter update, coalescing toggles made within FILTER_DEBOUNCE_MS"""
+        if self._filter_pending is not None:
+            self.root.after_cancel(self._filter_pending)
+        self._filter_pending = self.root.after(self.FILTER_DEBOUNCE_MS, self._apply_filters_now)
+    
+    def _apply_filters_now(self):
         """Apply filters to show/hide events based on selected types"""
-        for item in self.event_frames:
-            event_type = item['type']
-            frame = item['frame']
-            date_key = item['date_key']
-            
-            if self.filter_vars.get(event_type, tk.BooleanVar(value=True)).get():
-                frame.pack(fill="x", padx=5, pady=5)  # Show the event
-            else:
-                frame.pack_forget()  # Hide the event
+        self._filter_pending = None
+        active_types = {event_type for event_type, var in self.filter_vars.items() if var.get()}
+        
+        # Remember which rows were at the top of the view so the list doesn't jump
+        top = self.canvas.canvasy(0)
+        first = max(bisect.bisect_right(self.row_offsets, top) - 1, 0)
+        anchor_rows = self.visible_rows[first:]
+        anchor_shift = top - self.row_offsets[first] if anchor_rows else 0
+        
+        # Only rows whose type was toggled since the last call change visibility
+        visible_counts = self._visible_counts
+        for event_type in active_types ^ self._active_types:
+            visible = event_type in active_types
+            delta = 1 if visible else -1
+            for item in self._rows_by_type[event_type]:
+                item['visible'] = visible
+                visible_counts[item['date_key']] += delta
+        self._active_types = active_types
         
         # Show/hide date headers if all their events are hidden
-        for date_key, date_frame in self.date_frames.items():
-            # Check if any visible events remain for this date
-            visible_events = False
-            for item in self.event_frames:
-                if item['date_key'] == date_key and self.filter_vars.get(item['type'], tk.BooleanVar(value=True)).get():
-                    visible_events = True
-                    break
-            
-            if visible_events:
-                date_frame.pack(fill="x", pady=(10, 0))  # Show the date section
-            else:
-                date_frame.pack_forget()  # Hide the date section
+        for section in self.date_sections:
+            section['visible'] = self._visible_counts[section['date_key']] > 0
+        
+        self._layout()
+        
+        # Scroll back to the first previously shown row that is still visible
+        anchor = next((row for row in anchor_rows if row['visible']), None)
+        if anchor is not None and self.total_height:
+            self.canvas.yview_moveto((anchor['y'] + anchor_shift) / self.total_height)
     
     def submit(self):
-        # Get selected events directly
-        selected_events = []
-        
-        for var in self.var_checkboxes:
-            if var.get():
-                event_type = var.frame_data['type']
-                # Only include visible (filtered in) events
-                if self.filter_vars.get(event_type, tk.BooleanVar(value=True)).get():
-                    selected_events.append(var.frame_data['event_object'])
+        # Get selected events directly; only visible (filtered in) events count
+        active_types = {event_type for event_type, var in self.filter_vars.items() if var.get()}
+        selected_events = [event for event, var, event_type in self._rows
+                           if event_type in active_types and var.get()]
         
         if not selected_events:
             messagebox.showwarning("No Events Selected", "Please select at least one event to add to calendar.")
             return
         
-        # Create the events in Google Calendar - using the actual event objects
-        create_calendar_events_direct(selected_events)
-        
-        self.root.destroy()
+        # Create the events in Google Calendar on a worker thread so the window
+        # keeps repainting during the API calls; dialogs come back via _ui_calls.
+        # Cancel stays enabled and now stops the worker instead of closing the window
+        self.submit_btn.state(["disabled"])
+        self.cancel_btn.configure(command=self.cancel_submit)
+        self.root.configure(cursor="watch")
+        self.status_var.set(f"Submitting {len(selected_events)} events...")
+        self._worker = threading.Thread(
+            target=create_calendar_events_direct,
+            args=(selected_events, self._call_on_ui_thread, self._post_status, self._cancel_submit),
+            daemon=True
+        )
+        self._worker.start()
+        # Closing the window would end mainloop and kill the daemon worker mid-update,
+        # so a close request cancels like the Cancel button and _poll_worker closes
+        # the window once the worker has stopped
+        self.root.protocol("WM_DELETE_WINDOW", self.cancel_submit)
+        self._poll_worker()
+    
+    def cancel_submit(self):
+        """Ask the submission worker to stop before its next event or batch
+        
+        Used by both the Cancel button and the window's close button while
+        submitting; the window closes once the worker returns.
+        """
+        self._cancel_submit.set()
+        self.cancel_btn.state(["disabled"])
+        self.status_var.set("Cancelling...")
+    
+    def _call_on_ui_thread(self, func, *args, **kwargs):
+        """Run func on the Tk main thread from a worker and wait for its result"""
+        done = threading.Event()
+        result = {}
+        self._ui_calls.put((func, args, kwargs, result, done))
+        done.wait()
+        # A call that failed on the UI thread fails here too, in the worker
+        if 'error' in result:
+            raise result['error']
+        return result.get('value')
+    
+    def _post_status(self, text):
+        """Show a progress message from the worker without waiting for the UI"""
+        self._ui_calls.put((self.status_var.set, (text,), {}, {}, threading.Event()))
+    
+    def _poll_worker(self):
+        """Serve the worker's queued UI calls; close the window once it finishes"""
+        try:
+            while True:
+                try:
+                    func, args, kwargs, result, done = self._ui_calls.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    result['value'] = func(*args, **kwargs)
+                except Exception as e:
+                    logger.error("UI call %s failed: %s", getattr(func, '__name__', func), e)
+                    result['error'] = e
+                finally:
+                    done.set()
+        finally:
+            # Keep polling no matter what, or the window could never close
+            if self._worker.is_alive():
+                self.root.after(50, self._poll_worker)
+            else:
+                self.root.destroy()
 
 def main():
     """Main function to run the script with command line options"""
@@ -1167,17 +2160,19 @@ def main():
     parser.add_argument('--create-config', action='store_true', help='Create a default config file')
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # If create-config flag is set, just create the config file and exit
     if args.create_config:
         create_default_config()
         print("Default configuration file created. Edit it with your settings, then run the script again.")
         return
     
-    # If force-auth flag is set, remove token.pickle to force re-authentication
+    # If force-auth flag is set, remove token.json to force re-authentication
     if args.force_auth and os.path.exists(TOKEN_PATH):
         try:
             os.remove(TOKEN_PATH)
-            print("Removed old token.pickle file, will re-authenticate")
+            print("Removed old token.json file, will re-authenticate")
         except Exception as e:
             print(f"Failed to remove token file: {str(e)}")
     
@@ -1187,9 +2182,26 @@ def main():
         print("Please edit the newly created config.json file with your settings, then run the script again.")
         return
     
+    # Apply the configured log level (DEBUG shows per-page parsing details)
+    log_level = load_config().get("app", {}).get("log_level", "INFO")
+    try:
+        logging.getLogger().setLevel(str(log_level).upper())
+    except ValueError:
+        logger.warning("Unknown log_level '%s' in config.json, using INFO", log_level)
+    
+    # Look up what's already on the calendar so those events aren't scraped again.
+    # Only with a saved token: first-time authentication waits until events are submitted
+    existing_keys = None
+    if os.path.exists(TOKEN_PATH):
+        try:
+            service, calendar_id = get_calendar_service()
+            existing_keys = get_existing_event_keys(get_existing_events(service, calendar_id))
+        except Exception as e:
+            print(f"Could not check existing calendar events, scraping all events: {str(e)}")
+    
     print("Scraping events from LeekDuck...")
     
-    events = scrape_leekduck_events()
+    events = scrape_leekduck_events(existing_keys)
     print(f"Found {len(events)} events")
     
     if not events:
@@ -1198,11 +2210,6 @@ def main():
     
     # Launch Tkinter UI for event confirmation
     root = tk.Tk()
-    
-    # Configure the style
-    style = ttk.Style()
-    style.configure("Card.TFrame", relief="solid", borderwidth=1)
-    
     app = EventConfirmationUI(root, events)
     root.mainloop()
 